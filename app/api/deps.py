@@ -1,33 +1,78 @@
 from __future__ import annotations
 
+from typing import Generator
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import PyJWTError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.security import decode_access_token
-from app.db.models import User
-from app.db.session import get_db
+from app.core.token_cache import Principal, get_token_cache
+from app.db.models import AccountHolder, User
+from app.db.session import get_db, get_read_engine, get_recent_writes
 
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
+def _load_principal(session: Session, user_id: int) -> Principal | None:
+    row = session.execute(
+        select(User.id, User.email, AccountHolder.id)
+        .outerjoin(AccountHolder, AccountHolder.user_id == User.id)
+        .where(User.id == user_id)
+    ).first()
+    if not row:
+        return None
+    return Principal(id=row[0], email=row[1], holder_id=row[2])
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     session: Session = Depends(get_db),
-) -> User:
+) -> Principal:
     if not credentials or credentials.scheme.lower() != "bearer":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
+    token_cache = get_token_cache()
+    principal = token_cache.get(credentials.credentials)
+    if principal is not None:
+        session.info["user_id"] = principal.id
+        return principal
+
     try:
         payload = decode_access_token(credentials.credentials)
         user_id = int(payload.get("sub", "0"))
-    except (ValueError, PyJWTError):
+        holder_id = payload.get("holder_id")
+        if holder_id is not None:
+            principal = Principal(id=user_id, email=payload["email"], holder_id=int(holder_id))
+    except (KeyError, ValueError, PyJWTError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
-    user = session.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    if principal is None:
+        principal = _load_principal(session, user_id)
+        if principal is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized"
+            )
 
-    return user
+    token_cache.put(credentials.credentials, payload, principal)
+    session.info["user_id"] = principal.id
+    return principal
+
+
+def get_read_db(
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_db),
+) -> Generator[Session, None, None]:
+    read_engine = get_read_engine()
+    if read_engine is session.get_bind() or get_recent_writes().wrote_recently(current_user.id):
+        yield session
+        return
+
+    read_session = Session(bind=read_engine, autoflush=False)
+    try:
+        yield read_session
+    finally:
+        read_session.close()
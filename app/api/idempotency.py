@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from fastapi import Header, HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.token_cache import Principal
+from app.db.writer import run_write
+from app.services.idempotency import (
+    IdempotencyKeyMismatchError,
+    IdempotencyService,
+    StoredResponse,
+    request_hash,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def get_idempotency_key(
+    idempotency_key: str | None = Header(
+        default=None, alias="Idempotency-Key", min_length=1, max_length=255
+    ),
+) -> str | None:
+    return idempotency_key
+
+
+def _replay(stored: StoredResponse) -> Response:
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def _lookup(
+    session: Session, user: Principal, key: str, fingerprint: str
+) -> StoredResponse | None:
+    try:
+        return IdempotencyService(session).lookup(user.id, key, fingerprint)
+    except IdempotencyKeyMismatchError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+
+
+def run_idempotent_write(
+    session: Session,
+    user: Principal,
+    key: str | None,
+    scope: str,
+    payload: BaseModel,
+    fn: Callable[[Session], ModelT],
+    status_code: int = status.HTTP_201_CREATED,
+) -> ModelT | Response:
+    if key is None:
+        return run_write(session, fn)
+
+    fingerprint = request_hash(scope, payload)
+    stored = _lookup(session, user, key, fingerprint)
+    if stored is not None:
+        return _replay(stored)
+
+    def _apply(write_session: Session) -> ModelT:
+        result = fn(write_session)
+        IdempotencyService(write_session).save(
+            user.id, key, fingerprint, status_code, result.model_dump_json()
+        )
+        return result
+
+    try:
+        return run_write(session, _apply)
+    except IntegrityError:
+        # A concurrent request with the same key committed first; its write
+        # stands and this one was rolled back, so answer with its response.
+        session.rollback()
+        stored = _lookup(session, user, key, fingerprint)
+        if stored is None:
+            raise
+        return _replay(stored)
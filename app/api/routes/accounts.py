@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
-from app.db.models import User
-from app.db.session import get_db
-from app.schemas.accounts import AccountCreate, AccountRead
+from app.api.deps import get_current_user, get_read_db
+from app.api.etags import etag_matches, make_etag, not_modified, set_etag
+from app.core.config import get_settings
+from app.core.responses import fast_response, trusted_dump
+from app.core.token_cache import Principal
+from app.db.session import commit_write, get_db
+from app.schemas.accounts import AccountBalanceRead, AccountCreate, AccountRead
+from app.services.account_events import get_account_events, iter_account_events
 from app.services.account_service import AccountService
+from app.services.balance_service import BalanceService
+from app.services.read_models import AccountRow
 
 
 router = APIRouter(prefix="/v1/accounts", tags=["accounts"])
@@ -16,7 +25,7 @@ router = APIRouter(prefix="/v1/accounts", tags=["accounts"])
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=AccountRead)
 def create_account(
     payload: AccountCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: Session = Depends(get_db),
 ) -> AccountRead:
     service = AccountService(session)
@@ -24,26 +33,100 @@ def create_account(
         account = service.create_for_user(current_user, payload.type, payload.currency)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    commit_write(session)
     return account
 
 
 @router.get("", response_model=list[AccountRead])
 def list_accounts(
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_db),
-) -> list[AccountRead]:
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_read_db),
+) -> list[AccountRow] | Response:
     service = AccountService(session)
-    return service.list_for_user(current_user)
+    etag = make_etag(service.list_version_for_user(current_user))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    accounts = service.list_for_user(current_user)
+    if get_settings().fast_json_responses:
+        return fast_response([trusted_dump(AccountRead, account) for account in accounts], response)
+    return accounts
 
 
 @router.get("/{account_id}", response_model=AccountRead)
 def get_account(
     account_id: int,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_db),
-) -> AccountRead:
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_read_db),
+) -> AccountRead | Response:
     service = AccountService(session)
     account = service.get_for_user(current_user, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="account not found")
+    if get_settings().fast_json_responses:
+        return fast_response(trusted_dump(AccountRead, account))
     return account
+
+
+@router.get("/{account_id}/balance", response_model=AccountBalanceRead)
+def get_account_balance(
+    account_id: int,
+    as_of: datetime | None = Query(default=None),
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_read_db),
+) -> AccountBalanceRead:
+    account = AccountService(session).resolve_for_user(current_user, account_id)
+    if not account:
+        raise HTTPException(status_code=404, detail="account not found")
+    if account.holder_id != current_user.holder_id:
+        raise HTTPException(status_code=403, detail="account not accessible")
+
+    if as_of is None:
+        return AccountBalanceRead(
+            account_id=account.id,
+            currency=account.currency,
+            balance=account.balance,
+            as_of=datetime.now(timezone.utc),
+        )
+    return AccountBalanceRead(
+        account_id=account.id,
+        currency=account.currency,
+        balance=BalanceService(session).balance_at(account.id, as_of),
+        as_of=as_of,
+    )
+
+
+@router.get("/{account_id}/events", response_class=StreamingResponse)
+def stream_account_events(
+    account_id: int,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    account = AccountService(session).get_for_user(current_user, account_id)
+    if not account:
+        raise HTTPException(status_code=404, detail="account not found")
+    resume_from = None
+    if last_event_id:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="invalid Last-Event-ID") from exc
+
+    bind = session.get_bind()
+    # The stream stays open far longer than a request; give the connection
+    # back now and let catch-up reads open short sessions of their own.
+    session.close()
+    return StreamingResponse(
+        iter_account_events(
+            get_account_events(),
+            account_id,
+            bind,
+            heartbeat=get_settings().sse_heartbeat_seconds,
+            last_event_id=resume_from,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
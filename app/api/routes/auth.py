@@ -4,8 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
-from app.db.models import User
-from app.db.session import get_db, get_sessionmaker
+from app.core.token_cache import Principal
+from app.db.session import commit_write, get_db, get_sessionmaker
 from app.schemas.auth import (
     LoginRequest,
     MeResponse,
@@ -14,6 +14,7 @@ from app.schemas.auth import (
     SignupResponse,
     TokenResponse,
 )
+from app.services.audit_sink import get_audit_sink
 from app.services.auth_service import AuthService
 
 
@@ -68,21 +69,20 @@ def login(
 
     user = service.authenticate_user(payload.email, payload.password)
     if not user:
-        SessionLocal = get_sessionmaker()
-        with SessionLocal.begin() as audit_session:
-            AuthService(audit_session).write_audit_log(
-                user_id=None,
-                event_type="login",
-                status="failure",
-                ip_address=ip_address,
-                device_id=device_id,
-                metadata={"email": payload.email},
-            )
+        get_audit_sink().emit(
+            user_id=None,
+            event_type="login",
+            status="failure",
+            ip_address=ip_address,
+            device_id=device_id,
+            metadata={"email": payload.email},
+        )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid credentials"
         )
 
     tokens = service.issue_tokens(user, ip_address, device_id)
+    commit_write(session)
 
     return TokenResponse(**tokens)
 
@@ -110,5 +110,5 @@ def refresh(
 
 
 @router.get("/me", response_model=MeResponse)
-def me(current_user: User = Depends(get_current_user)) -> MeResponse:
+def me(current_user: Principal = Depends(get_current_user)) -> MeResponse:
     return MeResponse(id=current_user.id, email=current_user.email)
@@ -4,9 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
-from app.db.models import Account, User
-from app.db.session import get_db
+from app.core.token_cache import Principal
+from app.db.session import commit_write, get_db
 from app.schemas.cards import CardCreate, CardRead
+from app.services.account_service import AccountService
 from app.services.card_service import CardService
 
 
@@ -16,10 +17,10 @@ router = APIRouter(prefix="/v1/cards", tags=["cards"])
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=CardRead)
 def issue_card(
     payload: CardCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: Session = Depends(get_db),
 ) -> CardRead:
-    account = session.get(Account, payload.account_id)
+    account = AccountService(session).resolve_for_user(current_user, payload.account_id)
     if not account:
         raise HTTPException(status_code=404, detail="account not found")
 
@@ -28,4 +29,5 @@ def issue_card(
         card = service.issue_card(current_user, account, payload.type)
     except ValueError as exc:
         raise HTTPException(status_code=403, detail=str(exc)) from exc
+    commit_write(session)
     return card
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, HTTPException
 
+from app.core.hashing import get_password_hasher
 from app.db.session import check_db_health, get_engine
 
 
@@ -18,4 +19,5 @@ def health_check() -> dict:
         "status": "ok",
         "database": "ok",
         "timestamp": datetime.now(timezone.utc).isoformat(),
+        "password_hashing": get_password_hasher().stats(),
     }
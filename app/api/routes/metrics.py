@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.hashing import get_password_hasher
+from app.core.metrics import get_metrics
+from app.core.token_cache import get_token_cache
+from app.db.session import get_engine
+from app.services.audit_sink import get_audit_sink
+
+
+router = APIRouter(tags=["metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def collect_runtime_metrics():
+    pool = get_engine().pool
+    pool_samples = {
+        "db_pool_size": ("Configured connection pool size", getattr(pool, "size", None)),
+        "db_pool_checked_out": (
+            "Connections currently checked out of the pool",
+            getattr(pool, "checkedout", None),
+        ),
+        "db_pool_overflow": ("Connections open beyond pool_size", getattr(pool, "overflow", None)),
+    }
+    for name, (documentation, reader) in pool_samples.items():
+        if reader is not None:
+            yield name, "gauge", documentation, [(name, {}, reader())]
+
+    hashing = get_password_hasher().stats()
+    yield (
+        "password_hash_queue_depth",
+        "gauge",
+        "Password hashing jobs waiting for a worker",
+        [("password_hash_queue_depth", {}, hashing["queue_depth"])],
+    )
+    yield (
+        "password_hash_rejected_total",
+        "counter",
+        "Password hashing jobs rejected because the pool was saturated",
+        [("password_hash_rejected_total", {}, hashing["rejected_total"])],
+    )
+    yield (
+        "password_hash_duration_seconds",
+        "summary",
+        "Time spent hashing or verifying passwords",
+        [
+            ("password_hash_duration_seconds_sum", {}, hashing["latency_seconds_sum"]),
+            ("password_hash_duration_seconds_count", {}, hashing["completed_total"]),
+        ],
+    )
+
+    token_cache = get_token_cache().stats()
+    yield (
+        "token_cache_requests_total",
+        "counter",
+        "Access token cache lookups by result",
+        [
+            ("token_cache_requests_total", {"result": "hit"}, token_cache["hits"]),
+            ("token_cache_requests_total", {"result": "miss"}, token_cache["misses"]),
+        ],
+    )
+
+    yield (
+        "audit_queue_depth",
+        "gauge",
+        "Audit events waiting to be written",
+        [("audit_queue_depth", {}, get_audit_sink().queue_depth())],
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(get_metrics().render(), media_type=CONTENT_TYPE)
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
-from app.db.models import Account, User
-from app.db.session import get_db
+from app.api.deps import get_current_user, get_read_db
+from app.api.etags import etag_matches, make_etag, not_modified, set_etag
+from app.core.config import get_settings
+from app.core.responses import fast_response, trusted_dump
+from app.core.token_cache import Principal
 from app.schemas.statements import StatementResponse
-from app.services.statement_service import StatementService
+from app.schemas.transactions import TransactionRead
+from app.services.account_service import AccountService
+from app.services.balance_service import BalanceService
+from app.services.statement_service import (
+    DEFAULT_STATEMENT_LIMIT,
+    MAX_STATEMENT_LIMIT,
+    StatementService,
+    decode_cursor,
+    format_csv,
+    format_ndjson,
+)
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
 
 
 router = APIRouter(prefix="/v1/statements", tags=["statements"])
@@ -18,23 +35,104 @@ router = APIRouter(prefix="/v1/statements", tags=["statements"])
 @router.get("/{account_id}", response_model=StatementResponse)
 def get_statement(
     account_id: int,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_db),
-) -> StatementResponse:
-    account = session.get(Account, account_id)
+    response: Response,
+    limit: int = Query(default=DEFAULT_STATEMENT_LIMIT, ge=1, le=MAX_STATEMENT_LIMIT),
+    cursor: str | None = Query(default=None),
+    start: datetime | None = Query(default=None),
+    end: datetime | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_read_db),
+) -> StatementResponse | Response:
+    accounts = AccountService(session)
+    # The version check reads one account row and one index entry, so an
+    # unchanged statement is answered before any transactions are loaded.
+    version = accounts.version_for_user(current_user, account_id)
+    if version is not None:
+        etag = make_etag(version, limit, cursor, start, end)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
+    account = accounts.resolve_for_user(current_user, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="account not found")
 
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     service = StatementService(session)
     try:
-        transactions = service.get_statement(current_user, account)
+        transactions, next_cursor = service.get_statement(
+            current_user, account, limit=limit, after=after, start=start, end=end
+        )
     except ValueError as exc:
         raise HTTPException(status_code=403, detail=str(exc)) from exc
 
+    balances = BalanceService(session)
+    statement: dict[str, Any] = {
+        "account_id": account.id,
+        "currency": account.currency,
+        "balance": account.balance,
+        "opening_balance": (
+            balances.balance_at(account.id, start, inclusive=False) if start else None
+        ),
+        "closing_balance": (
+            balances.balance_at(account.id, end, inclusive=False) if end else None
+        ),
+        "generated_at": datetime.now(timezone.utc),
+        "next_cursor": next_cursor,
+    }
+    if get_settings().fast_json_responses:
+        statement["transactions"] = [trusted_dump(TransactionRead, row) for row in transactions]
+        return fast_response(statement, response)
     return StatementResponse(
-        account_id=account.id,
-        currency=account.currency,
-        balance=account.balance,
-        generated_at=datetime.now(timezone.utc),
-        transactions=transactions,
+        **statement,
+        transactions=[TransactionRead.model_validate(row) for row in transactions],
+    )
+
+
+@router.get("/{account_id}/export", response_class=StreamingResponse)
+def export_statement(
+    account_id: int,
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    start: datetime | None = Query(default=None),
+    end: datetime | None = Query(default=None),
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    account = AccountService(session).resolve_for_user(current_user, account_id)
+    if not account:
+        raise HTTPException(status_code=404, detail="account not found")
+    if account.holder_id != current_user.holder_id:
+        raise HTTPException(status_code=403, detail="account not accessible")
+
+    export_account_id = account.id
+    formatter = format_csv if export_format == "csv" else format_ndjson
+
+    export_bind = session.get_bind()
+    # Dependency teardown only runs after the body is sent, so release the
+    # request session's connection now; the export reads through its own
+    # session for the lifetime of the stream.
+    session.close()
+
+    def _stream() -> Iterator[str]:
+        with Session(bind=export_bind) as export_session:
+            rows = StatementService(export_session).iter_export_rows(
+                export_account_id, start=start, end=end
+            )
+            yield from formatter(rows)
+
+    return StreamingResponse(
+        _stream(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="statement-{export_account_id}.{export_format}"'
+            )
+        },
     )
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
-from app.db.models import Account, User
+from app.api.idempotency import get_idempotency_key, run_idempotent_write
+from app.core.token_cache import Principal
 from app.db.session import get_db
-from app.schemas.transactions import TransactionCreate, TransactionRead
-from app.services.transaction_service import TransactionService
+from app.db.writer import run_write
+from app.schemas.transactions import (
+    TransactionBatchCreate,
+    TransactionBatchItemResult,
+    TransactionBatchResponse,
+    TransactionCreate,
+    TransactionRead,
+)
+from app.services.account_service import AccountService
+from app.services.transaction_service import BatchOutcome, TransactionService
 
 
 router = APIRouter(prefix="/v1/transactions", tags=["transactions"])
@@ -16,28 +25,70 @@ router = APIRouter(prefix="/v1/transactions", tags=["transactions"])
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=TransactionRead)
 def create_transaction(
     payload: TransactionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: Session = Depends(get_db),
-) -> TransactionRead:
-    account = session.get(Account, payload.account_id)
-    if not account:
-        raise HTTPException(status_code=404, detail="account not found")
-
-    service = TransactionService(session)
-    try:
-        if payload.type == "deposit":
-            transaction = service.deposit(
-                current_user, account, payload.amount, payload.currency
-            )
-        elif payload.type == "withdrawal":
-            transaction = service.withdraw(
-                current_user, account, payload.amount, payload.currency
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="unsupported transaction type",
-            )
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return transaction
+    idempotency_key: str | None = Depends(get_idempotency_key),
+) -> TransactionRead | Response:
+    def _apply(write_session: Session) -> TransactionRead:
+        account = AccountService(write_session).resolve_for_user(
+            current_user, payload.account_id
+        )
+        if not account:
+            raise HTTPException(status_code=404, detail="account not found")
+
+        service = TransactionService(write_session)
+        try:
+            if payload.type == "deposit":
+                transaction = service.deposit(
+                    current_user, account, payload.amount, payload.currency
+                )
+                return TransactionRead.model_validate(transaction)
+            if payload.type == "withdrawal":
+                transaction = service.withdraw(
+                    current_user, account, payload.amount, payload.currency
+                )
+                return TransactionRead.model_validate(transaction)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="unsupported transaction type",
+        )
+
+    return run_idempotent_write(
+        session, current_user, idempotency_key, "POST /v1/transactions", payload, _apply
+    )
+
+
+@router.post(
+    "/batch", status_code=status.HTTP_201_CREATED, response_model=TransactionBatchResponse
+)
+def create_transaction_batch(
+    payload: TransactionBatchCreate,
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_db),
+) -> TransactionBatchResponse:
+    if current_user.holder_id is None:
+        raise HTTPException(status_code=400, detail="account holder not found")
+
+    def _apply(write_session: Session) -> list[BatchOutcome]:
+        return TransactionService(write_session).apply_batch(current_user, payload.items)
+
+    outcomes = run_write(session, _apply)
+    results = [
+        TransactionBatchItemResult(
+            index=index,
+            status="rejected" if outcome.error else "created",
+            transaction=(
+                TransactionRead.model_validate(outcome.transaction)
+                if outcome.transaction is not None
+                else None
+            ),
+            error=outcome.error,
+        )
+        for index, outcome in enumerate(outcomes)
+    ]
+    created = sum(result.status == "created" for result in results)
+    return TransactionBatchResponse(
+        created=created, rejected=len(results) - created, results=results
+    )
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
-from app.db.models import Account, User
+from app.api.idempotency import get_idempotency_key, run_idempotent_write
+from app.core.token_cache import Principal
 from app.db.session import get_db
-from app.schemas.transfers import TransferCreate, TransferRead
-from app.services.transfer_service import TransferService
+from app.db.writer import run_write
+from app.schemas.transfers import (
+    AccountNetChange,
+    TransferBatchCreate,
+    TransferBatchResponse,
+    TransferCreate,
+    TransferRead,
+)
+from app.services.transfer_service import (
+    TransferBatchError,
+    TransferBatchResult,
+    TransferService,
+)
 
 
 router = APIRouter(prefix="/v1/transfers", tags=["transfers"])
@@ -16,24 +28,58 @@ router = APIRouter(prefix="/v1/transfers", tags=["transfers"])
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=TransferRead)
 def create_transfer(
     payload: TransferCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     session: Session = Depends(get_db),
-) -> TransferRead:
-    from_account = session.get(Account, payload.from_account_id)
-    to_account = session.get(Account, payload.to_account_id)
-    if not from_account or not to_account:
-        raise HTTPException(status_code=404, detail="account not found")
-
-    service = TransferService(session)
-    try:
-        with session.begin_nested():
-            transfer = service.transfer(
-                current_user,
-                from_account,
-                to_account,
-                payload.amount,
-                payload.currency,
+    idempotency_key: str | None = Depends(get_idempotency_key),
+) -> TransferRead | Response:
+    def _apply(write_session: Session) -> TransferRead:
+        service = TransferService(write_session)
+        accounts = service.lock_accounts(payload.from_account_id, payload.to_account_id)
+        from_account = accounts.get(payload.from_account_id)
+        to_account = accounts.get(payload.to_account_id)
+        if not from_account or not to_account:
+            raise HTTPException(status_code=404, detail="account not found")
+
+        try:
+            with write_session.begin_nested():
+                transfer = service.transfer(
+                    current_user,
+                    from_account,
+                    to_account,
+                    payload.amount,
+                    payload.currency,
+                )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return TransferRead.model_validate(transfer)
+
+    return run_idempotent_write(
+        session, current_user, idempotency_key, "POST /v1/transfers", payload, _apply
+    )
+
+
+@router.post("/batch", status_code=status.HTTP_201_CREATED, response_model=TransferBatchResponse)
+def create_transfer_batch(
+    payload: TransferBatchCreate,
+    current_user: Principal = Depends(get_current_user),
+    session: Session = Depends(get_db),
+) -> TransferBatchResponse:
+    def _apply(write_session: Session) -> TransferBatchResult:
+        try:
+            return TransferService(write_session).transfer_batch(current_user, payload.items)
+        except TransferBatchError as exc:
+            raise HTTPException(
+                status_code=400,
+                detail=[{"index": index, "error": error} for index, error in exc.errors],
+            ) from exc
+
+    result = run_write(session, _apply)
+    return TransferBatchResponse(
+        transfers=[TransferRead.model_validate(transfer) for transfer in result.transfers],
+        net_changes=[
+            AccountNetChange(
+                account_id=account_id, delta=delta, balance=result.balances[account_id]
             )
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return transfer
+            for account_id, delta in result.net_changes.items()
+        ],
+    )
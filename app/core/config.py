@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -7,6 +8,25 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class AppSettings(BaseSettings):
     app_env: str = "dev"
     database_url: str = "sqlite:///./banking.db"
+    read_database_url: str | None = None
+    sqlite_read_pool: bool = True
+    read_your_writes_seconds: float = 5.0
+    write_mode: Literal["direct", "serialized", "group"] = "direct"
+    write_queue_size: int = 1000
+    write_queue_retry_after_seconds: int = 1
+    write_group_max_size: int = 64
+    write_group_max_wait_ms: float = 2
+    write_submit_timeout_seconds: float = 30
+    db_pool_class: Literal["queue", "null", "static", "singleton"] = "queue"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "FULL"
+    sqlite_cache_size: int = -64000
+    sqlite_mmap_size: int = 268435456
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    sqlite_wal_autocheckpoint: int = 1000
     log_level: str = "INFO"
     auto_migrate: bool = False
     jwt_secret: str = "dev_insecure_secret_change_me"
@@ -14,6 +34,20 @@ class AppSettings(BaseSettings):
     jwt_audience: str = "banking-service"
     access_token_ttl_minutes: int = 30
     refresh_token_ttl_days: int = 7
+    audit_log_mode: str = "async"
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 200
+    audit_flush_interval_ms: int = 200
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 16
+    password_hash_retry_after_seconds: int = 1
+    token_cache_size: int = 10000
+    fast_json_responses: bool = False
+    sse_heartbeat_seconds: float = 15
+    sse_buffer_size: int = 100
+    idempotency_ttl_seconds: int = 86400
+    idempotency_cache_size: int = 10000
+    idempotency_purge_interval_seconds: int = 300
 
     model_config = SettingsConfigDict(
         env_file=".env",
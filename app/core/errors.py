@@ -8,7 +8,9 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette import status
 
+from app.core.hashing import PasswordHashingBusyError
 from app.core.logging import get_logger
+from app.db.writer import WriteQueueFullError
 
 
 def _error_payload(code: str, message: str, details: Any | None = None) -> dict:
@@ -26,6 +28,7 @@ def _status_code_to_error_code(status_code: int) -> str:
         status.HTTP_404_NOT_FOUND: "not_found",
         status.HTTP_409_CONFLICT: "conflict",
         status.HTTP_422_UNPROCESSABLE_ENTITY: "validation_error",
+        status.HTTP_503_SERVICE_UNAVAILABLE: "service_unavailable",
     }
     return mapping.get(status_code, "http_error")
 
@@ -57,8 +60,21 @@ def add_exception_handlers(app) -> None:
             content=_error_payload(
                 _status_code_to_error_code(exc.status_code), message, details
             ),
+            headers=exc.headers,
         )
 
+    async def _service_busy_handler(
+        request: Request, exc: PasswordHashingBusyError | WriteQueueFullError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=_error_payload("service_unavailable", "Server busy, retry later"),
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    app.add_exception_handler(PasswordHashingBusyError, _service_busy_handler)
+    app.add_exception_handler(WriteQueueFullError, _service_busy_handler)
+
     @app.exception_handler(Exception)
     async def _unhandled_exception_handler(
         request: Request, exc: Exception
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(RuntimeError):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("password hashing capacity exhausted")
+        self.retry_after = retry_after
+
+
+class PasswordHashingExecutor:
+    def __init__(self, workers: int, max_queue: int, retry_after: int = 1) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self._retry_after = retry_after
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise PasswordHashingBusyError(self._retry_after)
+        with self._lock:
+            self._queued += 1
+        try:
+            return self._executor.submit(self._timed, fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def _timed(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        start = perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            average = self._total_seconds / self._completed if self._completed else 0.0
+            return {
+                "queue_depth": self._queued,
+                "in_progress": self._running,
+                "completed_total": self._completed,
+                "rejected_total": self._rejected,
+                "latency_seconds_sum": self._total_seconds,
+                "latency_ms_avg": round(average * 1000, 3),
+                "latency_ms_max": round(self._max_seconds * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHashingExecutor:
+    settings = get_settings()
+    return PasswordHashingExecutor(
+        workers=settings.password_hash_workers,
+        max_queue=settings.password_hash_max_queue,
+        retry_after=settings.password_hash_retry_after_seconds,
+    )
@@ -3,47 +3,111 @@ from __future__ import annotations
 from time import perf_counter
 from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
 from app.core.logging import get_logger
+from app.core.metrics import get_metrics
+from app.db.instrumentation import start_query_tracking, stop_query_tracking
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app) -> None:
-        super().__init__(app)
+class RequestLoggingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self._logger = get_logger()
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        request_id = request.headers.get("X-Request-Id") or str(uuid4())
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or str(uuid4())
         bind_contextvars(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
+            method=scope["method"],
+            path=scope["path"],
         )
         start_time = perf_counter()
+        status_code = 500
+        query_stats, query_token = start_query_tracking()
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-Id", request_id)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={query_stats.duration_ms};desc="{query_stats.count} queries"',
+                )
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         except Exception:
             duration_ms = int((perf_counter() - start_time) * 1000)
             self._logger.exception(
                 "request.failed",
                 status_code=500,
                 duration_ms=duration_ms,
+                db_queries=query_stats.count,
+                db_time_ms=query_stats.duration_ms,
             )
             clear_contextvars()
             raise
+        finally:
+            stop_query_tracking(query_token)
 
         duration_ms = int((perf_counter() - start_time) * 1000)
-        response.headers["X-Request-Id"] = request_id
         self._logger.info(
             "request.completed",
-            status_code=response.status_code,
+            status_code=status_code,
             duration_ms=duration_ms,
+            db_queries=query_stats.count,
+            db_time_ms=query_stats.duration_ms,
         )
         clear_contextvars()
-        return response
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        metrics = get_metrics()
+        self._duration = metrics.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route template, method and status",
+            ("method", "route", "status"),
+        )
+        self._in_flight = metrics.gauge(
+            "http_requests_in_flight", "HTTP requests currently being served", ("method",)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start_time = perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self._in_flight.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._in_flight.dec(method=method)
+            route = scope.get("route")
+            self._duration.observe(
+                perf_counter() - start_time,
+                method=method,
+                route=getattr(route, "path", "unmatched"),
+                status=str(status_code),
+            )
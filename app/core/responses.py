@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _field_names(model: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(model.model_fields)
+
+
+def trusted_dump(model: type[BaseModel], obj: Any) -> dict[str, Any]:
+    # Rows loaded from our own tables already satisfy the response schema, so
+    # copying the schema's attributes skips per-row validation entirely.
+    return {name: getattr(obj, name) for name in _field_names(model)}
+
+
+def fast_response(content: Any, response: Response | None = None) -> FastJSONResponse:
+    # Returning a Response bypasses FastAPI's header merge from the injected
+    # ``response`` parameter, so carry those headers over explicitly.
+    headers = None
+    if response is not None:
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in response.raw_headers
+            if key != b"content-length"
+        }
+    return FastJSONResponse(content, headers=headers)
@@ -9,6 +9,7 @@ import bcrypt
 import jwt
 
 from app.core.config import get_settings
+from app.core.hashing import get_password_hasher
 
 MAX_BCRYPT_PASSWORD_BYTES = 72
 
@@ -20,7 +21,9 @@ def _ensure_password_length(password: str) -> None:
 
 def hash_password(password: str) -> str:
     _ensure_password_length(password)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    hashed = get_password_hasher().run(
+        bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt()
+    )
     return hashed.decode("utf-8")
 
 
@@ -29,10 +32,14 @@ def verify_password(password: str, hashed_password: str) -> bool:
         _ensure_password_length(password)
     except ValueError:
         return False
-    return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+    return get_password_hasher().run(
+        bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
 
 
-def create_access_token(user_id: int, email: str) -> tuple[str, datetime]:
+def create_access_token(
+    user_id: int, email: str, holder_id: int | None = None
+) -> tuple[str, datetime]:
     settings = get_settings()
     now = datetime.now(timezone.utc)
     expires_at = now + timedelta(minutes=settings.access_token_ttl_minutes)
@@ -46,6 +53,8 @@ def create_access_token(user_id: int, email: str) -> tuple[str, datetime]:
         "aud": settings.jwt_audience,
         "jti": str(uuid4()),
     }
+    if holder_id is not None:
+        payload["holder_id"] = holder_id
     token = jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
     return token, expires_at
 
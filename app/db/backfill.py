@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.logging import configure_logging, get_logger
+from app.db.models import Transaction
+from app.db.session import begin_write_transaction, get_engine
+from app.services.balances import CREDIT_TYPES
+
+
+def _backfill_accounts(engine: Engine, account_ids: list[int]) -> int:
+    changes: list[dict] = []
+    with Session(engine) as session:
+        for account_id in account_ids:
+            rows = session.execute(
+                select(
+                    Transaction.id,
+                    Transaction.type,
+                    Transaction.amount,
+                    Transaction.balance_after,
+                )
+                .where(Transaction.account_id == account_id)
+                .order_by(Transaction.created_at, Transaction.id)
+            )
+            balance = 0
+            for transaction_id, type_, amount, balance_after in rows:
+                balance += amount if type_ in CREDIT_TYPES else -amount
+                if balance_after is None:
+                    changes.append({"id": transaction_id, "balance_after": balance})
+    if not changes:
+        return 0
+
+    # Running balances are computed outside the write lock; only the
+    # executemany update for the chunk holds it.
+    with Session(engine) as session, session.begin():
+        begin_write_transaction(session)
+        session.execute(update(Transaction), changes)
+    return len(changes)
+
+
+def backfill_balance_after(engine: Engine, workers: int = 4, chunk_size: int = 100) -> int:
+    with Session(engine) as session:
+        account_ids = list(
+            session.scalars(
+                select(Transaction.account_id)
+                .where(Transaction.balance_after.is_(None))
+                .distinct()
+                .order_by(Transaction.account_id)
+            )
+        )
+    chunks = [
+        account_ids[start : start + chunk_size] for start in range(0, len(account_ids), chunk_size)
+    ]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as executor:
+        return sum(executor.map(lambda chunk: _backfill_accounts(engine, chunk), chunks))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Backfill transactions.balance_after")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=100, help="accounts per transaction")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    updated = backfill_balance_after(get_engine(), args.workers, args.chunk_size)
+    get_logger().info("backfill.completed", column="transactions.balance_after", rows=updated)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import get_metrics
+
+
+@dataclass(slots=True)
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 3)
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_tracking() -> tuple[QueryStats, Token]:
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_tracking(token: Token) -> None:
+    _query_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    queries = get_metrics().counter(
+        "db_queries_total", "SQL statements executed", ("operation",)
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query(_conn, _cursor, statement, _parameters, context, _executemany) -> None:
+        # Kept on the execution context, so a statement that raises leaves
+        # nothing behind on the pooled connection.
+        context._query_start_time = perf_counter()
+        queries.inc(operation=statement.lstrip().split(" ", 1)[0].lower())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish_query(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+        elapsed = perf_counter() - context._query_start_time
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+
+    _instrument_pool(engine)
+
+
+def _instrument_pool(engine: Engine) -> None:
+    # Pool events are registered on the engine, so they carry over to the pool
+    # that dispose() recreates. No event fires before a checkout starts, so
+    # queueing shows up as long holds while db_pool_checked_out sits at size.
+    held_seconds = get_metrics().histogram(
+        "db_pool_checkout_seconds",
+        "Time a connection is held between pool checkout and checkin",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+    opened = get_metrics().counter(
+        "db_pool_connections_opened_total", "DBAPI connections opened by the pool"
+    )
+
+    @event.listens_for(engine, "connect")
+    def _opened(_dbapi_connection, _connection_record) -> None:
+        opened.inc()
+
+    @event.listens_for(engine, "checkout")
+    def _checked_out(_dbapi_connection, connection_record, _connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _checked_in(_dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            held_seconds.observe(perf_counter() - checked_out_at)
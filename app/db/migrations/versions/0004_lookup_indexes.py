@@ -0,0 +1,47 @@
+"""lookup indexes
+
+Revision ID: 0004_lookup_indexes
+Revises: 0003_core_resources
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from alembic import op
+
+revision = "0004_lookup_indexes"
+down_revision = "0003_core_resources"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_account_id_created_at_id",
+        "transactions",
+        ["account_id", "created_at", "id"],
+    )
+    op.create_index("ix_accounts_holder_id", "accounts", ["holder_id"])
+    op.create_index(
+        "ix_transfers_from_account_id_created_at",
+        "transfers",
+        ["from_account_id", "created_at"],
+    )
+    op.create_index(
+        "ix_transfers_to_account_id_created_at",
+        "transfers",
+        ["to_account_id", "created_at"],
+    )
+    op.create_index("ix_cards_account_id", "cards", ["account_id"])
+    op.create_index(
+        "ix_audit_logs_user_id_created_at",
+        "audit_logs",
+        ["user_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_user_id_created_at", table_name="audit_logs")
+    op.drop_index("ix_cards_account_id", table_name="cards")
+    op.drop_index("ix_transfers_to_account_id_created_at", table_name="transfers")
+    op.drop_index("ix_transfers_from_account_id_created_at", table_name="transfers")
+    op.drop_index("ix_accounts_holder_id", table_name="accounts")
+    op.drop_index("ix_transactions_account_id_created_at_id", table_name="transactions")
@@ -0,0 +1,72 @@
+"""balance snapshots
+
+Revision ID: 0005_balance_snapshots
+Revises: 0004_lookup_indexes
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from datetime import timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_balance_snapshots"
+down_revision = "0004_lookup_indexes"
+branch_labels = None
+depends_on = None
+
+CREDIT_TYPES = ("deposit", "transfer_in")
+
+
+def upgrade() -> None:
+    snapshots = op.create_table(
+        "balance_snapshots",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("account_id", sa.Integer, sa.ForeignKey("accounts.id"), nullable=False),
+        sa.Column("snapshot_date", sa.Date, nullable=False),
+        sa.Column("balance", sa.Integer, nullable=False),
+        sa.Column("as_of", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "account_id",
+            "snapshot_date",
+            name="uq_balance_snapshots_account_id_snapshot_date",
+        ),
+    )
+
+    # Seed one closing snapshot per account per day from existing history.
+    transactions = sa.table(
+        "transactions",
+        sa.column("id", sa.Integer),
+        sa.column("account_id", sa.Integer),
+        sa.column("type", sa.String),
+        sa.column("amount", sa.Integer),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            transactions.c.account_id,
+            transactions.c.type,
+            transactions.c.amount,
+            transactions.c.created_at,
+        ).order_by(transactions.c.account_id, transactions.c.created_at, transactions.c.id)
+    )
+    closing: dict[tuple[int, object], dict] = {}
+    running: dict[int, int] = {}
+    for account_id, type_, amount, created_at in rows:
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        balance = running.get(account_id, 0) + (amount if type_ in CREDIT_TYPES else -amount)
+        running[account_id] = balance
+        snapshot_date = created_at.astimezone(timezone.utc).date()
+        closing[(account_id, snapshot_date)] = {
+            "account_id": account_id,
+            "snapshot_date": snapshot_date,
+            "balance": balance,
+            "as_of": created_at,
+        }
+    if closing:
+        op.bulk_insert(snapshots, list(closing.values()))
+
+
+def downgrade() -> None:
+    op.drop_table("balance_snapshots")
@@ -0,0 +1,24 @@
+"""transaction running balance
+
+Revision ID: 0006_transaction_balance_after
+Revises: 0005_balance_snapshots
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_transaction_balance_after"
+down_revision = "0005_balance_snapshots"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows are filled by `python -m app.db.backfill`.
+    op.add_column("transactions", sa.Column("balance_after", sa.Integer, nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_column("balance_after")
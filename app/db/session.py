@@ -1,30 +1,75 @@
 from __future__ import annotations
 
+import threading
 from functools import lru_cache
-from typing import Generator
+from time import monotonic
+from typing import Callable, Generator
 
 from alembic import command
 from alembic.config import Config
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
 
-from app.core.config import get_settings
+from app.core.config import AppSettings, get_settings
+from app.db.instrumentation import instrument_engine
 
 
-def _configure_sqlite(engine: Engine) -> None:
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool,
+    "singleton": SingletonThreadPool,
+}
+
+
+def sqlite_pragmas(settings: AppSettings) -> list[str]:
+    return [
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA cache_size={settings.sqlite_cache_size}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA temp_store={settings.sqlite_temp_store}",
+        f"PRAGMA wal_autocheckpoint={settings.sqlite_wal_autocheckpoint}",
+    ]
+
+
+def _configure_sqlite(engine: Engine, pragmas: list[str], query_only: bool = False) -> None:
     if engine.url.get_backend_name() != "sqlite":
         return
 
     @event.listens_for(engine, "connect")
     def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA busy_timeout=5000")
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        if query_only:
+            cursor.execute("PRAGMA query_only=ON")
         cursor.close()
 
 
-def create_engine_from_url(database_url: str) -> Engine:
+def _pool_options(settings: AppSettings) -> dict:
+    options: dict = {"poolclass": POOL_CLASSES[settings.db_pool_class]}
+    if settings.db_pool_class == "queue":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+        )
+    return options
+
+
+def _is_sqlite_file(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def create_engine_from_url(
+    database_url: str, query_only: bool = False, settings: AppSettings | None = None
+) -> Engine:
+    settings = settings or get_settings()
     connect_args = {}
     if database_url.startswith("sqlite"):
         connect_args = {"check_same_thread": False, "timeout": 30}
@@ -34,8 +79,10 @@ def create_engine_from_url(database_url: str) -> Engine:
         connect_args=connect_args,
         pool_pre_ping=True,
         future=True,
+        **_pool_options(settings),
     )
-    _configure_sqlite(engine)
+    _configure_sqlite(engine, sqlite_pragmas(settings), query_only=query_only)
+    instrument_engine(engine)
     return engine
 
 
@@ -45,17 +92,82 @@ def get_engine(database_url: str | None = None) -> Engine:
     return create_engine_from_url(resolved_url)
 
 
+@lru_cache
+def _get_read_engine(database_url: str, query_only: bool) -> Engine:
+    return create_engine_from_url(database_url, query_only=query_only)
+
+
+def get_read_engine() -> Engine:
+    settings = get_settings()
+    if settings.read_database_url:
+        return _get_read_engine(settings.read_database_url, False)
+    if settings.sqlite_read_pool and _is_sqlite_file(settings.database_url):
+        # WAL readers never block the writer, so a query_only pool on the
+        # same file keeps reads off the connections used for writes.
+        return _get_read_engine(settings.database_url, True)
+    return get_engine()
+
+
 def get_sessionmaker() -> sessionmaker:
     engine = get_engine()
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
+class RecentWrites:
+    def __init__(self, window_seconds: float, max_entries: int = 10000) -> None:
+        self._window = window_seconds
+        self._max_entries = max_entries
+        self._last_write: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: int) -> None:
+        now = monotonic()
+        with self._lock:
+            self._last_write[user_id] = now
+            if len(self._last_write) > self._max_entries:
+                cutoff = now - self._window
+                self._last_write = {
+                    key: value for key, value in self._last_write.items() if value > cutoff
+                }
+
+    def wrote_recently(self, user_id: int) -> bool:
+        with self._lock:
+            last_write = self._last_write.get(user_id)
+        return last_write is not None and monotonic() - last_write < self._window
+
+
+@lru_cache
+def get_recent_writes() -> RecentWrites:
+    return RecentWrites(window_seconds=get_settings().read_your_writes_seconds)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_session_writes(session: Session, _flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+def mark_recent_write(session: Session) -> None:
+    user_id = session.info.get("user_id")
+    if user_id is not None and session.info.pop("has_writes", False):
+        get_recent_writes().mark(user_id)
+
+
+def commit_write(session: Session) -> None:
+    # Request-scoped teardown runs after the response is sent, so write routes
+    # commit and mark the user before returning; a client reading right after
+    # the response must see its write.
+    session.expire_on_commit = False
+    session.commit()
+    mark_recent_write(session)
+
+
 def get_db() -> Generator[Session, None, None]:
     SessionLocal = get_sessionmaker()
     session = SessionLocal()
     try:
         yield session
         session.commit()
+        mark_recent_write(session)
     except Exception:
         session.rollback()
         raise
@@ -63,6 +175,28 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+DEFERRED_AFTER_COMMIT_KEY = "deferred_after_commit"
+
+
+def defer_until_committed(session: Session, callback: Callable[[], None]) -> None:
+    # Group-commit units commit a savepoint; the writer runs their callbacks
+    # once the shared transaction has committed.
+    deferred = session.info.get(DEFERRED_AFTER_COMMIT_KEY)
+    if deferred is None:
+        callback()
+    else:
+        deferred.append(callback)
+
+
+def begin_write_transaction(target: Session | Connection) -> None:
+    connection = target.connection() if isinstance(target, Session) else target
+    if connection.dialect.name != "sqlite":
+        return
+    dbapi_connection = connection.connection.dbapi_connection
+    if dbapi_connection is not None and not dbapi_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
 def check_db_health(engine: Engine) -> bool:
     try:
         with engine.connect() as connection:
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from time import monotonic
+from typing import Callable, TypeVar
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.session import (
+    DEFERRED_AFTER_COMMIT_KEY,
+    begin_write_transaction,
+    commit_write,
+    get_engine,
+    mark_recent_write,
+)
+
+T = TypeVar("T")
+WriteUnit = Callable[[Session], T]
+
+_STOP = object()
+
+
+class WriteQueueFullError(RuntimeError):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("write queue is full")
+        self.retry_after = retry_after
+
+
+class SerializedWriter:
+    def __init__(
+        self,
+        engine: Engine,
+        queue_size: int = 1000,
+        retry_after: int = 1,
+        group_size: int = 1,
+        group_wait: float = 0.0,
+        submit_timeout: float | None = None,
+    ) -> None:
+        self._engine = engine
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._retry_after = retry_after
+        self._group_size = max(group_size, 1)
+        self._group_wait = group_wait
+        self._submit_timeout = submit_timeout
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._units = 0
+        self._commits = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"units": self._units, "commits": self._commits}
+
+    def submit(self, fn: WriteUnit[T]) -> T:
+        self.start()
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((fn, future))
+        except queue.Full:
+            raise WriteQueueFullError(self._retry_after) from None
+        try:
+            return future.result(timeout=self._submit_timeout)
+        except FutureTimeoutError:
+            # A unit that never started is withdrawn and safe to retry. One
+            # already running is always resolved by the writer, so wait it out
+            # rather than report a write that may commit as rejected.
+            if future.cancel():
+                raise WriteQueueFullError(self._retry_after) from None
+            return future.result()
+
+    def _run(self) -> None:
+        batch: list = []
+        try:
+            with self._engine.connect() as connection:
+                stopping = False
+                while not stopping:
+                    batch, stopping = self._next_batch()
+                    batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+                    if not batch:
+                        continue
+                    if self._group_size == 1:
+                        fn, future = batch[0]
+                        try:
+                            future.set_result(self._execute(connection, fn))
+                        except BaseException as exc:
+                            future.set_exception(exc)
+                    else:
+                        self._execute_group(connection, batch)
+        except BaseException as exc:
+            self._fail_outstanding(batch, exc)
+
+    def _fail_outstanding(self, batch: list, exc: BaseException) -> None:
+        # The writer thread is exiting; nothing left behind may wait forever.
+        # Queued units never ran, so their callers get a retryable rejection.
+        with self._lock:
+            if self._thread is threading.current_thread():
+                self._thread = None
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP and item[1].set_running_or_notify_cancel():
+                    item[1].set_exception(WriteQueueFullError(self._retry_after))
+
+    def _next_batch(self) -> tuple[list, bool]:
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = monotonic() + self._group_wait
+        while len(batch) < self._group_size:
+            try:
+                item = self._queue.get(timeout=max(deadline - monotonic(), 0))
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _execute(self, connection: Connection, fn: WriteUnit[T]) -> T:
+        with Session(bind=connection, autoflush=False, expire_on_commit=False) as session:
+            try:
+                begin_write_transaction(session)
+                result = fn(session)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        self._record(units=1)
+        return result
+
+    def _execute_group(self, connection: Connection, batch: list) -> None:
+        # One commit for the whole batch; each unit runs in its own session on
+        # a savepoint so a failing unit is rolled back without touching the rest.
+        # Failed units are answered only once the shared transaction is over, so
+        # a caller that retries or looks up after its failure sees the outcome
+        # of the units that were committed with it.
+        completed: list[tuple[Future, object]] = []
+        failed: list[tuple[Future, BaseException]] = []
+        deferred: list[Callable[[], None]] = []
+        try:
+            with connection.begin():
+                begin_write_transaction(connection)
+                for fn, future in batch:
+                    with Session(
+                        bind=connection,
+                        autoflush=False,
+                        expire_on_commit=False,
+                        join_transaction_mode="create_savepoint",
+                        info={DEFERRED_AFTER_COMMIT_KEY: deferred},
+                    ) as session:
+                        try:
+                            result = fn(session)
+                            session.commit()
+                        except Exception as exc:
+                            session.rollback()
+                            failed.append((future, exc))
+                        else:
+                            completed.append((future, result))
+        except BaseException as exc:
+            for future, unit_exc in failed:
+                future.set_exception(unit_exc)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self._record(units=len(completed))
+        for future, result in completed:
+            future.set_result(result)
+        for future, unit_exc in failed:
+            future.set_exception(unit_exc)
+        # The writes are committed; a failing callback must not undo that for
+        # the callers or take the writer down.
+        for callback in deferred:
+            try:
+                callback()
+            except Exception:
+                get_logger().exception("writer.deferred_callback_failed")
+
+    def _record(self, units: int) -> None:
+        with self._lock:
+            self._units += units
+            self._commits += 1
+
+
+@lru_cache
+def get_db_writer() -> SerializedWriter:
+    settings = get_settings()
+    grouped = settings.write_mode == "group"
+    return SerializedWriter(
+        get_engine(),
+        queue_size=settings.write_queue_size,
+        retry_after=settings.write_queue_retry_after_seconds,
+        group_size=settings.write_group_max_size if grouped else 1,
+        group_wait=settings.write_group_max_wait_ms / 1000 if grouped else 0.0,
+        submit_timeout=settings.write_submit_timeout_seconds,
+    )
+
+
+def run_write(session: Session, fn: WriteUnit[T]) -> T:
+    if get_settings().write_mode == "direct":
+        result = fn(session)
+        commit_write(session)
+        return result
+    result = get_db_writer().submit(fn)
+    session.info["has_writes"] = True
+    mark_recent_write(session)
+    return result
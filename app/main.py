@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routes.account_holders import router as account_holders_router
@@ -8,14 +9,20 @@ from app.api.routes.accounts import router as accounts_router
 from app.api.routes.auth import router as auth_router
 from app.api.routes.cards import router as cards_router
 from app.api.routes.health import router as health_router
+from app.api.routes.metrics import collect_runtime_metrics
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.statements import router as statements_router
 from app.api.routes.transactions import router as transactions_router
 from app.api.routes.transfers import router as transfers_router
 from app.core.config import get_settings
 from app.core.errors import add_exception_handlers
 from app.core.logging import configure_logging
-from app.core.middleware import RequestLoggingMiddleware
+from app.core.metrics import get_metrics
+from app.core.responses import FastJSONResponse
+from app.core.middleware import RequestLoggingMiddleware, RequestMetricsMiddleware
 from app.db.session import assert_db_healthy, run_migrations
+from app.db.writer import get_db_writer
+from app.services.audit_sink import get_audit_sink
 
 
 def create_app() -> FastAPI:
@@ -25,11 +32,17 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Banking Service",
         version="0.1.0",
+        default_response_class=(
+            FastJSONResponse if settings.fast_json_responses else JSONResponse
+        ),
     )
 
+    app.add_middleware(RequestMetricsMiddleware)
     app.add_middleware(RequestLoggingMiddleware)
+    get_metrics().register_collector(collect_runtime_metrics)
     add_exception_handlers(app)
     app.include_router(health_router)
+    app.include_router(metrics_router)
     app.include_router(auth_router)
     app.include_router(account_holders_router)
     app.include_router(accounts_router)
@@ -47,6 +60,17 @@ def create_app() -> FastAPI:
         assert_db_healthy()
         if settings.auto_migrate:
             run_migrations(settings.database_url)
+        get_audit_sink().start()
+        if settings.write_mode != "direct":
+            get_db_writer().start()
+
+    @app.on_event("shutdown")
+    def _drain_background_writers() -> None:
+        if settings.write_mode != "direct":
+            get_db_writer().stop()
+            get_db_writer.cache_clear()
+        get_audit_sink().stop()
+        get_audit_sink.cache_clear()
 
     return app
 
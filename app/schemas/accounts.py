@@ -25,3 +25,10 @@ class AccountRead(BaseModel):
     balance: int
     status: AccountStatus
     created_at: datetime
+
+
+class AccountBalanceRead(BaseModel):
+    account_id: int
+    currency: str
+    balance: int
+    as_of: datetime
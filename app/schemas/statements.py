@@ -11,5 +11,8 @@ class StatementResponse(BaseModel):
     account_id: int
     currency: str
     balance: int
+    opening_balance: int | None = None
+    closing_balance: int | None = None
     generated_at: datetime
     transactions: list[TransactionRead]
+    next_cursor: str | None = None
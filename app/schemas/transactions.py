@@ -8,6 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 TransactionType = Literal["deposit", "withdrawal", "transfer_in", "transfer_out"]
 TransactionCreateType = Literal["deposit", "withdrawal"]
+MAX_BATCH_ITEMS = 1000
 
 
 class TransactionCreate(BaseModel):
@@ -25,4 +26,22 @@ class TransactionRead(BaseModel):
     type: TransactionType
     amount: int
     currency: str
+    balance_after: int | None = None
     created_at: datetime
+
+
+class TransactionBatchCreate(BaseModel):
+    items: list[TransactionCreate] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class TransactionBatchItemResult(BaseModel):
+    index: int
+    status: Literal["created", "rejected"]
+    transaction: TransactionRead | None = None
+    error: str | None = None
+
+
+class TransactionBatchResponse(BaseModel):
+    created: int
+    rejected: int
+    results: list[TransactionBatchItemResult]
@@ -4,6 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+MAX_TRANSFER_BATCH_ITEMS = 10000
+
 
 class TransferCreate(BaseModel):
     from_account_id: int
@@ -21,3 +23,18 @@ class TransferRead(BaseModel):
     amount: int
     currency: str
     created_at: datetime
+
+
+class TransferBatchCreate(BaseModel):
+    items: list[TransferCreate] = Field(min_length=1, max_length=MAX_TRANSFER_BATCH_ITEMS)
+
+
+class AccountNetChange(BaseModel):
+    account_id: int
+    delta: int
+    balance: int
+
+
+class TransferBatchResponse(BaseModel):
+    transfers: list[TransferRead]
+    net_changes: list[AccountNetChange]
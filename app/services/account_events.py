@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.responses import dumps, trusted_dump
+from app.db.models import Transaction
+from app.db.session import defer_until_committed
+from app.schemas.transactions import TransactionRead
+from app.services.read_models import TRANSACTION_ROW_COLUMNS, TransactionRow
+
+_PENDING_KEY = "pending_account_events"
+CATCH_UP_PAGE_SIZE = 500
+RETRY_MS = 3000
+
+
+@dataclass(frozen=True, slots=True)
+class AccountEvent:
+    id: int
+    data: str
+
+    def encode(self) -> str:
+        return f"id: {self.id}\nevent: transaction\ndata: {self.data}\n\n"
+
+
+def _to_event(row: TransactionRow) -> AccountEvent:
+    return AccountEvent(id=row.id, data=dumps(trusted_dump(TransactionRead, row)).decode())
+
+
+class Subscription:
+    def __init__(
+        self, account_id: int, loop: asyncio.AbstractEventLoop, buffer_size: int
+    ) -> None:
+        self.account_id = account_id
+        self.loop = loop
+        self.overflowed = False
+        self._queue: asyncio.Queue[AccountEvent] = asyncio.Queue(maxsize=buffer_size)
+
+    def offer(self, account_event: AccountEvent) -> None:
+        # Runs on the subscriber's event loop. A full buffer drops the event and
+        # flags the stream to catch up from the database instead.
+        try:
+            self._queue.put_nowait(account_event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def next(self, timeout: float) -> AccountEvent | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drain(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+
+class AccountEventBroker:
+    def __init__(self, buffer_size: int) -> None:
+        self._buffer_size = buffer_size
+        self._subscriptions: dict[int, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, account_id: int) -> Subscription:
+        subscription = Subscription(account_id, asyncio.get_running_loop(), self._buffer_size)
+        with self._lock:
+            self._subscriptions.setdefault(account_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.account_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.account_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def publish(self, rows: Iterable[TransactionRow]) -> None:
+        with self._lock:
+            targets = {
+                account_id: tuple(subscriptions)
+                for account_id, subscriptions in self._subscriptions.items()
+            }
+        if not targets:
+            return
+        for row in rows:
+            subscriptions = targets.get(row.account_id)
+            if not subscriptions:
+                continue
+            # Serialized once and shared by every connection on the account.
+            account_event = _to_event(row)
+            for subscription in subscriptions:
+                # A closed loop means the subscriber is going away; it
+                # unsubscribes itself on exit.
+                with suppress(RuntimeError):
+                    subscription.loop.call_soon_threadsafe(subscription.offer, account_event)
+
+
+def record_account_events(session: Session, rows: Iterable[TransactionRow]) -> None:
+    session.info.setdefault(_PENDING_KEY, []).extend(rows)
+
+
+def _publish(rows: list[TransactionRow]) -> None:
+    # Runs after the money has moved; a fan-out failure only costs the live
+    # feed, which clients recover by reconnecting with Last-Event-ID.
+    try:
+        get_account_events().publish(rows)
+    except Exception:
+        get_logger().exception("account_events.publish_failed", events=len(rows))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_events(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        defer_until_committed(session, lambda: _publish(rows))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_events(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _latest_event_id(bind: Engine | Connection, account_id: int) -> int:
+    with Session(bind=bind) as session:
+        return session.execute(
+            select(func.coalesce(func.max(Transaction.id), 0)).where(
+                Transaction.account_id == account_id
+            )
+        ).scalar_one()
+
+
+def _load_after(bind: Engine | Connection, account_id: int, after_id: int) -> list[AccountEvent]:
+    with Session(bind=bind) as session:
+        rows = session.execute(
+            select(*TRANSACTION_ROW_COLUMNS)
+            .where(Transaction.account_id == account_id, Transaction.id > after_id)
+            .order_by(Transaction.id)
+            .limit(CATCH_UP_PAGE_SIZE)
+        )
+        return [_to_event(TransactionRow(*row)) for row in rows]
+
+
+async def iter_account_events(
+    broker: AccountEventBroker,
+    account_id: int,
+    bind: Engine | Connection,
+    heartbeat: float,
+    last_event_id: int | None = None,
+) -> AsyncIterator[str]:
+    # Subscribe before reading the starting point so nothing committed in
+    # between is missed; duplicates are filtered by id below.
+    subscription = broker.subscribe(account_id)
+    catch_up = last_event_id is not None
+    replayed: set[int] = set()
+    try:
+        if last_event_id is None:
+            cursor = await asyncio.to_thread(_latest_event_id, bind, account_id)
+        else:
+            cursor = last_event_id
+        # The client already has everything up to here.
+        floor = cursor
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            if catch_up or subscription.overflowed:
+                # Buffered events are superseded by the rows read back here.
+                # Rows committed during the catch-up land on its last page and
+                # may also arrive live, so those ids are skipped once.
+                subscription.overflowed = False
+                subscription.drain()
+                while True:
+                    events = await asyncio.to_thread(
+                        _load_after, bind, subscription.account_id, cursor
+                    )
+                    replayed = {loaded.id for loaded in events}
+                    for loaded in events:
+                        cursor = loaded.id
+                        yield loaded.encode()
+                    if len(events) < CATCH_UP_PAGE_SIZE:
+                        break
+                catch_up = False
+                continue
+
+            account_event = await subscription.next(heartbeat)
+            if account_event is None:
+                yield ": keep-alive\n\n"
+                continue
+            if account_event.id <= floor:
+                continue
+            if account_event.id in replayed:
+                replayed.discard(account_event.id)
+                continue
+            cursor = max(cursor, account_event.id)
+            yield account_event.encode()
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@lru_cache
+def get_account_events() -> AccountEventBroker:
+    return AccountEventBroker(buffer_size=get_settings().sse_buffer_size)
@@ -3,7 +3,8 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.db.models import AccountHolder, User
+from app.core.token_cache import Principal
+from app.db.models import AccountHolder
 
 
 class AccountHolderService:
@@ -11,7 +12,7 @@ class AccountHolderService:
         self._session = session
 
     def create_for_user(
-        self, user: User, first_name: str, last_name: str, dob
+        self, user: Principal, first_name: str, last_name: str, dob
     ) -> AccountHolder:
         existing = self._session.scalar(
             select(AccountHolder).where(AccountHolder.user_id == user.id)
@@ -29,13 +30,13 @@ class AccountHolderService:
         self._session.flush()
         return holder
 
-    def list_for_user(self, user: User) -> list[AccountHolder]:
+    def list_for_user(self, user: Principal) -> list[AccountHolder]:
         holder = self._session.scalar(
             select(AccountHolder).where(AccountHolder.user_id == user.id)
         )
         return [holder] if holder else []
 
-    def get_for_user(self, user: User, holder_id: int) -> AccountHolder | None:
+    def get_for_user(self, user: Principal, holder_id: int) -> AccountHolder | None:
         return self._session.scalar(
             select(AccountHolder).where(
                 AccountHolder.user_id == user.id, AccountHolder.id == holder_id
@@ -3,20 +3,21 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.db.models import Account, AccountHolder, User
+from app.core.token_cache import Principal
+from app.db.models import Account, Transaction
+from app.services.read_models import ACCOUNT_ROW_COLUMNS, AccountRow
 
 
 class AccountService:
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def create_for_user(self, user: User, account_type: str, currency: str) -> Account:
-        holder = self._get_holder(user)
-        if not holder:
+    def create_for_user(self, user: Principal, account_type: str, currency: str) -> Account:
+        if user.holder_id is None:
             raise ValueError("account holder not found")
 
         account = Account(
-            holder_id=holder.id,
+            holder_id=user.holder_id,
             type=account_type,
             currency=currency,
             balance=0,
@@ -26,25 +27,59 @@ class AccountService:
         self._session.flush()
         return account
 
-    def list_for_user(self, user: User) -> list[Account]:
-        holder = self._get_holder(user)
-        if not holder:
+    def list_for_user(self, user: Principal) -> list[AccountRow]:
+        if user.holder_id is None:
             return []
-        return list(
-            self._session.scalars(select(Account).where(Account.holder_id == holder.id))
-        )
+        return [
+            AccountRow(*row)
+            for row in self._session.execute(
+                select(*ACCOUNT_ROW_COLUMNS).where(Account.holder_id == user.holder_id)
+            )
+        ]
 
-    def get_for_user(self, user: User, account_id: int) -> Account | None:
-        holder = self._get_holder(user)
-        if not holder:
+    def get_for_user(self, user: Principal, account_id: int) -> Account | None:
+        if user.holder_id is None:
             return None
         return self._session.scalar(
             select(Account).where(
-                Account.holder_id == holder.id, Account.id == account_id
+                Account.holder_id == user.holder_id, Account.id == account_id
             )
         )
 
-    def _get_holder(self, user: User) -> AccountHolder | None:
-        return self._session.scalar(
-            select(AccountHolder).where(AccountHolder.user_id == user.id)
+    def resolve_for_user(self, user: Principal, account_id: int) -> Account | None:
+        account = self.get_for_user(user, account_id)
+        if account is None:
+            account = self._session.get(Account, account_id)
+        return account
+
+    def version_for_user(self, user: Principal, account_id: int) -> str | None:
+        if user.holder_id is None:
+            return None
+        # Balance alone can repeat (a deposit followed by an equal withdrawal),
+        # so the newest transaction id is part of the version as well.
+        latest = (
+            select(Transaction.id)
+            .where(Transaction.account_id == Account.id)
+            .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        row = self._session.execute(
+            select(Account.balance, Account.status, latest).where(
+                Account.holder_id == user.holder_id, Account.id == account_id
+            )
+        ).first()
+        if row is None:
+            return None
+        balance, status, latest_id = row
+        return f"{account_id}:{balance}:{status}:{latest_id or 0}"
+
+    def list_version_for_user(self, user: Principal) -> str:
+        if user.holder_id is None:
+            return ""
+        rows = self._session.execute(
+            select(Account.id, Account.balance, Account.status)
+            .where(Account.holder_id == user.holder_id)
+            .order_by(Account.id)
         )
+        return ";".join(f"{account_id}:{balance}:{status}" for account_id, balance, status in rows)
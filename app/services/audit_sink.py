@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import queue
+import threading
+from functools import lru_cache
+from time import monotonic
+from typing import Any, cast
+
+from sqlalchemy import Table, event, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.models import AuditLog, utc_now
+from app.db.session import get_engine
+
+_PENDING_KEY = "pending_audit_events"
+_STOP = object()
+
+
+class AuditSink:
+    def __init__(
+        self,
+        mode: str = "async",
+        queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.2,
+    ) -> None:
+        if mode not in {"async", "sync"}:
+            raise ValueError(f"unsupported audit log mode: {mode}")
+        self.mode = mode
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._thread: threading.Thread | None = None
+        self._logger = get_logger()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self.mode != "async" or self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        self._thread = None
+
+    def flush(self, timeout: float = 5.0) -> None:
+        if not self.running:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def record(self, session: Session, **fields: Any) -> None:
+        if self.mode == "sync":
+            session.add(AuditLog(**_to_model_fields(_build_row(fields))))
+            return
+        session.info.setdefault(_PENDING_KEY, []).append(_build_row(fields))
+
+    def emit(self, **fields: Any) -> None:
+        self._submit([_build_row(fields)])
+
+    def _submit(self, rows: list[dict]) -> None:
+        if self.mode == "sync" or not self.running:
+            self._write(rows)
+            return
+        for index, row in enumerate(rows):
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self._logger.warning("audit.queue_full", queue_size=self._queue.maxsize)
+                self._write(rows[index:])
+                return
+
+    def _run(self) -> None:
+        batch: list[dict] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                if not batch:
+                    deadline = monotonic() + self._flush_interval
+                batch.append(item)
+                if len(batch) < self._batch_size:
+                    continue
+            elif item is None and batch and monotonic() < deadline:
+                continue
+
+            if batch:
+                self._write(batch)
+                batch = []
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _write(self, rows: list[dict]) -> None:
+        try:
+            with get_engine().begin() as connection:
+                connection.execute(insert(cast(Table, AuditLog.__table__)), rows)
+        except Exception:
+            if len(rows) > 1:
+                for row in rows:
+                    self._write([row])
+                return
+            self._logger.exception("audit.write_failed", event_type=rows[0]["event_type"])
+
+
+def _build_row(fields: dict[str, Any]) -> dict:
+    return {
+        "user_id": fields.get("user_id"),
+        "event_type": fields["event_type"],
+        "resource_type": fields.get("resource_type"),
+        "resource_id": fields.get("resource_id"),
+        "status": fields["status"],
+        "ip_address": fields["ip_address"],
+        "device_id": fields["device_id"],
+        "metadata": fields.get("metadata"),
+        "created_at": utc_now(),
+    }
+
+
+def _to_model_fields(row: dict) -> dict:
+    fields = dict(row)
+    fields["meta"] = fields.pop("metadata")
+    return fields
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_events(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        get_audit_sink()._submit(rows)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_events(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+@lru_cache
+def get_audit_sink() -> AuditSink:
+    settings = get_settings()
+    return AuditSink(
+        mode=settings.audit_log_mode,
+        queue_size=settings.audit_queue_size,
+        batch_size=settings.audit_batch_size,
+        flush_interval=settings.audit_flush_interval_ms / 1000,
+    )
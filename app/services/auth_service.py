@@ -8,7 +8,8 @@ from sqlalchemy.orm import Session
 
 from app.core import security
 from app.core.config import get_settings
-from app.db.models import AccountHolder, AuditLog, RefreshToken, User
+from app.db.models import AccountHolder, RefreshToken, User
+from app.services.audit_sink import get_audit_sink
 
 
 class AuthService:
@@ -50,7 +51,7 @@ class AuthService:
 
     def issue_tokens(self, user: User, ip_address: str, device_id: str) -> dict:
         access_token, access_expires_at = security.create_access_token(
-            user.id, user.email
+            user.id, user.email, self._get_holder_id(user.id)
         )
 
         refresh_token = security.create_refresh_token()
@@ -106,7 +107,7 @@ class AuthService:
             return None
 
         access_token, access_expires_at = security.create_access_token(
-            user.id, user.email
+            user.id, user.email, self._get_holder_id(user.id)
         )
         new_refresh_token = security.create_refresh_token()
         new_refresh_hash = security.hash_refresh_token(new_refresh_token)
@@ -137,6 +138,11 @@ class AuthService:
             "expires_in": int((access_expires_at - now).total_seconds()),
         }
 
+    def _get_holder_id(self, user_id: int) -> int | None:
+        return self._session.scalar(
+            select(AccountHolder.id).where(AccountHolder.user_id == user_id)
+        )
+
     def _normalize_timestamp(self, value: datetime) -> datetime:
         if value.tzinfo is None:
             return value.replace(tzinfo=timezone.utc)
@@ -175,7 +181,8 @@ class AuthService:
         resource_id: str | None = None,
         metadata: dict | None = None,
     ) -> None:
-        audit_log = AuditLog(
+        get_audit_sink().record(
+            self._session,
             user_id=user_id,
             event_type=event_type,
             resource_type=resource_type,
@@ -183,6 +190,5 @@ class AuthService:
             status=status,
             ip_address=ip_address,
             device_id=device_id,
-            meta=metadata,
+            metadata=metadata,
         )
-        self._session.add(audit_log)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.db.models import BalanceSnapshot, Transaction, as_utc
+from app.services.balances import CREDIT_TYPES
+
+
+class BalanceService:
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def balance_at(self, account_id: int, moment: datetime, inclusive: bool = True) -> int:
+        # Closing snapshot of the last active day before ``moment`` plus that
+        # day's transactions, so the scan is bounded to a single day.
+        moment = as_utc(moment)
+        snapshot = self._session.execute(
+            select(BalanceSnapshot.balance, BalanceSnapshot.as_of)
+            .where(
+                BalanceSnapshot.account_id == account_id,
+                BalanceSnapshot.snapshot_date < moment.date(),
+            )
+            .order_by(BalanceSnapshot.snapshot_date.desc())
+            .limit(1)
+        ).first()
+
+        signed_amount = case(
+            (Transaction.type.in_(CREDIT_TYPES), Transaction.amount),
+            else_=-Transaction.amount,
+        )
+        delta = select(func.coalesce(func.sum(signed_amount), 0)).where(
+            Transaction.account_id == account_id,
+            Transaction.created_at <= moment if inclusive else Transaction.created_at < moment,
+        )
+        if snapshot is None:
+            return self._session.execute(delta).scalar_one()
+        return snapshot.balance + self._session.execute(
+            delta.where(Transaction.created_at > as_utc(snapshot.as_of))
+        ).scalar_one()
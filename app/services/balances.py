@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import Table, bindparam, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.db.models import Account, BalanceSnapshot, as_utc
+
+CREDIT_TYPES = ("deposit", "transfer_in")
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE for the snapshot upsert.
+UPSERT_DIALECTS = {"postgresql": postgresql, "sqlite": sqlite}
+
+
+def credit_account(session: Session, account: Account, amount: int) -> int:
+    new_balance = session.execute(
+        update(Account)
+        .where(Account.id == account.id)
+        .values(balance=Account.balance + amount)
+        .returning(Account.balance)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+    set_committed_value(account, "balance", new_balance)
+    return new_balance
+
+
+def debit_account(session: Session, account: Account, amount: int) -> int:
+    new_balance = session.execute(
+        update(Account)
+        .where(Account.id == account.id, Account.balance >= amount)
+        .values(balance=Account.balance - amount)
+        .returning(Account.balance)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if new_balance is None:
+        raise ValueError("insufficient funds")
+    set_committed_value(account, "balance", new_balance)
+    return new_balance
+
+
+def apply_balance_changes(
+    session: Session, accounts: dict[int, Account], balances: dict[int, int]
+) -> None:
+    # One executemany UPDATE for the net change of every touched account; the
+    # caller holds the row locks, so the resulting balances equal ``balances``.
+    changes = [
+        {"account_pk": account_id, "delta": balance - accounts[account_id].balance}
+        for account_id, balance in balances.items()
+        if balance != accounts[account_id].balance
+    ]
+    if not changes:
+        return
+    table = cast(Table, Account.__table__)
+    session.execute(
+        update(table)
+        .where(table.c.id == bindparam("account_pk"))
+        .values(balance=table.c.balance + bindparam("delta")),
+        changes,
+    )
+    for change in changes:
+        account_id = change["account_pk"]
+        set_committed_value(accounts[account_id], "balance", balances[account_id])
+
+
+def record_balance_snapshot(
+    session: Session, account_id: int, balance: int, as_of: datetime
+) -> None:
+    as_of = as_utc(as_of)
+    dialect_name = session.get_bind().dialect.name
+    dialect = UPSERT_DIALECTS.get(dialect_name)
+    if dialect is None:
+        raise RuntimeError(f"balance snapshots are not supported on {dialect_name}")
+    statement = dialect.insert(BalanceSnapshot).values(
+        account_id=account_id,
+        snapshot_date=as_of.date(),
+        balance=balance,
+        as_of=as_of,
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["account_id", "snapshot_date"],
+            set_={"balance": statement.excluded.balance, "as_of": statement.excluded.as_of},
+        )
+    )
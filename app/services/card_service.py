@@ -4,15 +4,16 @@ import secrets
 
 from sqlalchemy.orm import Session
 
-from app.db.models import Account, Card, User
+from app.core.token_cache import Principal
+from app.db.models import Account, Card
 
 
 class CardService:
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def issue_card(self, user: User, account: Account, card_type: str) -> Card:
-        if account.holder.user_id != user.id:
+    def issue_card(self, user: Principal, account: Account, card_type: str) -> Card:
+        if account.holder_id != user.holder_id:
             raise ValueError("account not accessible")
 
         last4 = str(secrets.randbelow(10000)).zfill(4)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from time import time
+from typing import Any, cast
+
+from pydantic import BaseModel
+from sqlalchemy import CursorResult, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.models import IdempotencyKey, as_utc, utc_now
+
+
+class IdempotencyKeyMismatchError(ValueError):
+    def __init__(self) -> None:
+        super().__init__("idempotency key reused with a different request")
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    request_hash: str
+    status_code: int
+    body: str
+    expires_at: float
+
+
+class IdempotencyCache:
+    def __init__(self, max_entries: int, purge_interval: float = 300) -> None:
+        self._max_entries = max_entries
+        self._purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._entries: OrderedDict[tuple[int, str], StoredResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, key: str) -> StoredResponse | None:
+        with self._lock:
+            entry = self._entries.get((user_id, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time():
+                del self._entries[(user_id, key)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((user_id, key))
+            self.hits += 1
+            return entry
+
+    def put(self, user_id: int, key: str, response: StoredResponse) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(user_id, key)] = response
+            self._entries.move_to_end((user_id, key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def purge_due(self, now: float) -> bool:
+        with self._lock:
+            if now < self._next_purge:
+                return False
+            self._next_purge = now + self._purge_interval
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def request_hash(scope: str, payload: BaseModel) -> str:
+    return hashlib.sha256(f"{scope}\n{payload.model_dump_json()}".encode()).hexdigest()
+
+
+class IdempotencyService:
+    def __init__(self, session: Session, cache: IdempotencyCache | None = None) -> None:
+        self._session = session
+        self._cache = cache or get_idempotency_cache()
+
+    def lookup(self, user_id: int, key: str, request_hash: str) -> StoredResponse | None:
+        # Only committed rows are cached, so a replay never reflects a write
+        # that was later rolled back.
+        stored = self._cache.get(user_id, key)
+        if stored is None:
+            row = self._session.execute(
+                select(
+                    IdempotencyKey.request_hash,
+                    IdempotencyKey.status_code,
+                    IdempotencyKey.response_body,
+                    IdempotencyKey.expires_at,
+                ).where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.key == key,
+                    IdempotencyKey.expires_at > utc_now(),
+                )
+            ).first()
+            if row is None:
+                return None
+            stored = StoredResponse(
+                request_hash=row.request_hash,
+                status_code=row.status_code,
+                body=row.response_body,
+                expires_at=as_utc(row.expires_at).timestamp(),
+            )
+            self._cache.put(user_id, key, stored)
+        if stored.request_hash != request_hash:
+            raise IdempotencyKeyMismatchError()
+        return stored
+
+    def save(
+        self, user_id: int, key: str, request_hash: str, status_code: int, body: str
+    ) -> None:
+        now = utc_now()
+        if self._cache.purge_due(now.timestamp()):
+            self.purge_expired(now)
+        else:
+            self._session.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.key == key,
+                    IdempotencyKey.expires_at <= now,
+                )
+            )
+        self._session.execute(
+            insert(IdempotencyKey).values(
+                user_id=user_id,
+                key=key,
+                request_hash=request_hash,
+                status_code=status_code,
+                response_body=body,
+                created_at=now,
+                expires_at=now + timedelta(seconds=get_settings().idempotency_ttl_seconds),
+            )
+        )
+
+    def purge_expired(self, now: datetime | None = None) -> int:
+        result = cast(
+            CursorResult[Any],
+            self._session.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.expires_at <= (now or utc_now()))
+            ),
+        )
+        return result.rowcount
+
+
+@lru_cache
+def get_idempotency_cache() -> IdempotencyCache:
+    settings = get_settings()
+    return IdempotencyCache(
+        max_entries=settings.idempotency_cache_size,
+        purge_interval=settings.idempotency_purge_interval_seconds,
+    )
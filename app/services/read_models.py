@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.db.models import Account, Transaction
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionRow:
+    id: int
+    account_id: int
+    type: str
+    amount: int
+    currency: str
+    balance_after: int | None
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRow:
+    id: int
+    holder_id: int
+    type: str
+    currency: str
+    balance: int
+    status: str
+    created_at: datetime
+
+
+def _columns(model: type, row_type: type) -> tuple[InstrumentedAttribute, ...]:
+    return tuple(getattr(model, field.name) for field in fields(row_type))
+
+
+def transaction_row(transaction: Transaction) -> TransactionRow:
+    return TransactionRow(*(getattr(transaction, field.name) for field in fields(TransactionRow)))
+
+
+# Selecting these columns instead of the entity skips the identity map and
+# attribute instrumentation; rows are plain read-only values.
+TRANSACTION_ROW_COLUMNS = _columns(Transaction, TransactionRow)
+ACCOUNT_ROW_COLUMNS = _columns(Account, AccountRow)
@@ -1,22 +1,155 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+import base64
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from sqlalchemy import Row, and_, or_, select
 from sqlalchemy.orm import Session
 
-from app.db.models import Account, Transaction, User
+from app.core.token_cache import Principal
+from app.db.models import Account, Transaction, as_utc
+from app.services.read_models import TRANSACTION_ROW_COLUMNS, TransactionRow
+
+DEFAULT_STATEMENT_LIMIT = 100
+MAX_STATEMENT_LIMIT = 500
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = (
+    "id",
+    "account_id",
+    "type",
+    "amount",
+    "currency",
+    "balance_after",
+    "created_at",
+)
+
+
+def encode_cursor(created_at: datetime, transaction_id: int) -> str:
+    payload = {"c": as_utc(created_at).isoformat(), "i": transaction_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at = as_utc(datetime.fromisoformat(payload["c"]))
+        transaction_id = int(payload["i"])
+    except (ValueError, KeyError, TypeError, UnicodeEncodeError) as exc:
+        raise ValueError("invalid cursor") from exc
+    return created_at, transaction_id
+
+
+def format_ndjson(
+    rows: Iterable[Row], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[str]:
+    lines: list[str] = []
+    for row in rows:
+        record = dict(zip(EXPORT_FIELDS, row, strict=True))
+        record["created_at"] = as_utc(record["created_at"]).isoformat()
+        lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+        if len(lines) >= batch_size:
+            yield "".join(lines)
+            lines.clear()
+    if lines:
+        yield "".join(lines)
+
+
+def format_csv(rows: Iterable[Row], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    pending = 0
+    for *values, created_at in rows:
+        writer.writerow((*values, as_utc(created_at).isoformat()))
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
 
 
 class StatementService:
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def get_statement(self, user: User, account: Account) -> list[Transaction]:
-        if account.holder.user_id != user.id:
+    def get_statement(
+        self,
+        user: Principal,
+        account: Account,
+        limit: int = DEFAULT_STATEMENT_LIMIT,
+        after: tuple[datetime, int] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> tuple[list[TransactionRow], str | None]:
+        if account.holder_id != user.holder_id:
             raise ValueError("account not accessible")
-        return list(
-            self._session.scalars(
-                select(Transaction)
-                .where(Transaction.account_id == account.id)
-                .order_by(Transaction.created_at.desc())
+
+        query = select(*TRANSACTION_ROW_COLUMNS).where(Transaction.account_id == account.id)
+        if start is not None:
+            query = query.where(Transaction.created_at >= as_utc(start))
+        if end is not None:
+            query = query.where(Transaction.created_at < as_utc(end))
+        if after is not None:
+            cursor_created_at, cursor_id = after
+            query = query.where(
+                or_(
+                    Transaction.created_at < cursor_created_at,
+                    and_(
+                        Transaction.created_at == cursor_created_at,
+                        Transaction.id < cursor_id,
+                    ),
+                )
+            )
+
+        rows = [
+            TransactionRow(*row)
+            for row in self._session.execute(
+                query.order_by(Transaction.created_at.desc(), Transaction.id.desc()).limit(
+                    limit + 1
+                )
+            )
+        ]
+        if len(rows) <= limit:
+            return rows, None
+
+        page = rows[:limit]
+        last = page[-1]
+        return page, encode_cursor(last.created_at, last.id)
+
+    def iter_export_rows(
+        self,
+        account_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[Row]:
+        query = select(*(getattr(Transaction, field) for field in EXPORT_FIELDS)).where(
+            Transaction.account_id == account_id
+        )
+        if start is not None:
+            query = query.where(Transaction.created_at >= as_utc(start))
+        if end is not None:
+            query = query.where(Transaction.created_at < as_utc(end))
+
+        result = self._session.execute(
+            query.order_by(Transaction.created_at, Transaction.id).execution_options(
+                stream_results=True, yield_per=batch_size
             )
         )
+        try:
+            yield from result
+        finally:
+            result.close()
@@ -1,8 +1,38 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Protocol, Sequence
+
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
-from app.db.models import Account, Transaction, User
+from app.core.token_cache import Principal
+from app.db.models import Account, Transaction
+from app.db.session import begin_write_transaction
+from app.services.account_events import record_account_events
+from app.services.balances import (
+    apply_balance_changes,
+    credit_account,
+    debit_account,
+    record_balance_snapshot,
+)
+from app.services.read_models import transaction_row
+
+
+class TransactionRequest(Protocol):
+    account_id: int
+    amount: int
+    currency: str
+
+    # Read-only so schemas that narrow ``type`` to a Literal still match.
+    @property
+    def type(self) -> str: ...
+
+
+@dataclass(slots=True)
+class BatchOutcome:
+    transaction: Transaction | None = None
+    error: str | None = None
 
 
 class TransactionService:
@@ -10,44 +40,136 @@ class TransactionService:
         self._session = session
 
     def deposit(
-        self, user: User, account: Account, amount: int, currency: str
+        self, user: Principal, account: Account, amount: int, currency: str
     ) -> Transaction:
         self._ensure_owner(user, account)
         self._ensure_currency(account, currency)
 
-        account.balance += amount
+        balance_after = credit_account(self._session, account, amount)
         transaction = Transaction(
             account_id=account.id,
             type="deposit",
             amount=amount,
             currency=currency,
+            balance_after=balance_after,
         )
         self._session.add(transaction)
         self._session.flush()
+        record_balance_snapshot(
+            self._session, account.id, account.balance, transaction.created_at
+        )
+        record_account_events(self._session, [transaction_row(transaction)])
         return transaction
 
     def withdraw(
-        self, user: User, account: Account, amount: int, currency: str
+        self, user: Principal, account: Account, amount: int, currency: str
     ) -> Transaction:
         self._ensure_owner(user, account)
         self._ensure_currency(account, currency)
 
-        if account.balance - amount < 0:
-            raise ValueError("insufficient funds")
-
-        account.balance -= amount
+        balance_after = debit_account(self._session, account, amount)
         transaction = Transaction(
             account_id=account.id,
             type="withdrawal",
             amount=amount,
             currency=currency,
+            balance_after=balance_after,
         )
         self._session.add(transaction)
         self._session.flush()
+        record_balance_snapshot(
+            self._session, account.id, account.balance, transaction.created_at
+        )
+        record_account_events(self._session, [transaction_row(transaction)])
         return transaction
 
-    def _ensure_owner(self, user: User, account: Account) -> None:
-        if account.holder.user_id != user.id:
+    def apply_batch(
+        self, user: Principal, items: Sequence[TransactionRequest]
+    ) -> list[BatchOutcome]:
+        begin_write_transaction(self._session)
+        accounts = {
+            account.id: account
+            for account in self._session.scalars(
+                select(Account)
+                .where(
+                    Account.id.in_({item.account_id for item in items}),
+                    Account.holder_id == user.holder_id,
+                )
+                .order_by(Account.id)
+                .with_for_update(of=Account)
+                .execution_options(populate_existing=True)
+            )
+        }
+        # Only the caller's accounts are locked; tell missing ids apart from
+        # other holders' accounts the way the single-item routes do.
+        missing = {item.account_id for item in items} - accounts.keys()
+        missing_errors = dict.fromkeys(missing, "account not found")
+        if missing:
+            for account_id in self._session.scalars(
+                select(Account.id).where(Account.id.in_(missing))
+            ):
+                missing_errors[account_id] = "account not accessible"
+
+        # Items are applied in order against in-memory balances; the account
+        # rows stay locked until commit, so the final balances are exact.
+        balances = {account_id: account.balance for account_id, account in accounts.items()}
+        outcomes: list[BatchOutcome] = []
+        rows: list[dict] = []
+        for item in items:
+            account = accounts.get(item.account_id)
+            if account is None:
+                outcomes.append(BatchOutcome(error=missing_errors[item.account_id]))
+                continue
+            if account.currency != item.currency:
+                outcomes.append(BatchOutcome(error="currency mismatch"))
+                continue
+            if item.type == "withdrawal":
+                if balances[account.id] < item.amount:
+                    outcomes.append(BatchOutcome(error="insufficient funds"))
+                    continue
+                balances[account.id] -= item.amount
+            else:
+                balances[account.id] += item.amount
+            outcomes.append(BatchOutcome())
+            rows.append(
+                {
+                    "account_id": account.id,
+                    "type": item.type,
+                    "amount": item.amount,
+                    "currency": item.currency,
+                    "balance_after": balances[account.id],
+                }
+            )
+        if not rows:
+            return outcomes
+
+        apply_balance_changes(self._session, accounts, balances)
+        # executemany has no ordered RETURNING on SQLite, so read the new rows
+        # back by id; the locked accounts cannot gain rows from anyone else.
+        last_id = self._session.scalar(select(func.coalesce(func.max(Transaction.id), 0)))
+        self._session.execute(insert(Transaction), rows)
+        transactions = iter(
+            self._session.scalars(
+                select(Transaction)
+                .where(Transaction.id > last_id, Transaction.account_id.in_(accounts))
+                .order_by(Transaction.id)
+            ).all()
+        )
+        last_created_at = {}
+        for outcome in outcomes:
+            if outcome.error is None:
+                outcome.transaction = next(transactions)
+                last_created_at[outcome.transaction.account_id] = outcome.transaction.created_at
+        for account_id, created_at in last_created_at.items():
+            record_balance_snapshot(self._session, account_id, balances[account_id], created_at)
+        record_account_events(
+            self._session,
+            [transaction_row(outcome.transaction) for outcome in outcomes if outcome.transaction],
+        )
+        return outcomes
+
+    def _ensure_owner(self, user: Principal, account: Account) -> None:
+        if account.holder_id != user.holder_id:
             raise ValueError("account not accessible")
 
     def _ensure_currency(self, account: Account, currency: str) -> None:
@@ -1,33 +1,76 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Protocol, Sequence
+
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
-from app.db.models import Account, Transaction, Transfer, User
+from app.core.token_cache import Principal
+from app.db.models import Account, Transaction, Transfer, utc_now
+from app.db.session import begin_write_transaction
+from app.services.account_events import record_account_events
+from app.services.balances import (
+    apply_balance_changes,
+    credit_account,
+    debit_account,
+    record_balance_snapshot,
+)
+from app.services.read_models import TransactionRow, transaction_row
+
+
+class TransferRequest(Protocol):
+    from_account_id: int
+    to_account_id: int
+    amount: int
+    currency: str
+
+
+@dataclass(slots=True)
+class TransferBatchResult:
+    transfers: list[Transfer]
+    net_changes: dict[int, int]
+    balances: dict[int, int]
+
+
+class TransferBatchError(ValueError):
+    def __init__(self, errors: list[tuple[int, str]]) -> None:
+        super().__init__("transfer batch rejected")
+        self.errors = errors
 
 
 class TransferService:
     def __init__(self, session: Session) -> None:
         self._session = session
 
+    def lock_accounts(self, *account_ids: int) -> dict[int, Account]:
+        begin_write_transaction(self._session)
+        accounts = self._session.scalars(
+            select(Account)
+            .where(Account.id.in_(sorted(set(account_ids))))
+            .order_by(Account.id)
+            .with_for_update(of=Account)
+            .execution_options(populate_existing=True)
+        )
+        return {account.id: account for account in accounts}
+
     def transfer(
         self,
-        user: User,
+        user: Principal,
         from_account: Account,
         to_account: Account,
         amount: int,
         currency: str,
     ) -> Transfer:
-        if from_account.holder.user_id != user.id:
+        if from_account.holder_id != user.holder_id:
             raise ValueError("account not accessible")
         if from_account.id == to_account.id:
             raise ValueError("cannot transfer to same account")
         if from_account.currency != currency or to_account.currency != currency:
             raise ValueError("currency mismatch")
-        if from_account.balance - amount < 0:
-            raise ValueError("insufficient funds")
 
-        from_account.balance -= amount
-        to_account.balance += amount
+        from_balance = debit_account(self._session, from_account, amount)
+        to_balance = credit_account(self._session, to_account, amount)
 
         transfer = Transfer(
             from_account_id=from_account.id,
@@ -35,22 +78,135 @@ class TransferService:
             amount=amount,
             currency=currency,
         )
-        self._session.add(transfer)
-        self._session.add_all(
-            [
-                Transaction(
-                    account_id=from_account.id,
-                    type="transfer_out",
-                    amount=amount,
-                    currency=currency,
-                ),
-                Transaction(
-                    account_id=to_account.id,
-                    type="transfer_in",
-                    amount=amount,
-                    currency=currency,
-                ),
-            ]
+        outgoing = Transaction(
+            account_id=from_account.id,
+            type="transfer_out",
+            amount=amount,
+            currency=currency,
+            balance_after=from_balance,
+        )
+        incoming = Transaction(
+            account_id=to_account.id,
+            type="transfer_in",
+            amount=amount,
+            currency=currency,
+            balance_after=to_balance,
         )
+        self._session.add(transfer)
+        self._session.add_all([outgoing, incoming])
         self._session.flush()
+        record_balance_snapshot(
+            self._session, from_account.id, from_account.balance, outgoing.created_at
+        )
+        record_balance_snapshot(
+            self._session, to_account.id, to_account.balance, incoming.created_at
+        )
+        record_account_events(
+            self._session, [transaction_row(outgoing), transaction_row(incoming)]
+        )
         return transfer
+
+    def transfer_batch(
+        self, user: Principal, items: Sequence[TransferRequest]
+    ) -> TransferBatchResult:
+        accounts = self.lock_accounts(
+            *(item.from_account_id for item in items), *(item.to_account_id for item in items)
+        )
+        balances = {account_id: account.balance for account_id, account in accounts.items()}
+        errors: list[tuple[int, str]] = []
+        transaction_rows: list[dict] = []
+        for index, item in enumerate(items):
+            from_account = accounts.get(item.from_account_id)
+            to_account = accounts.get(item.to_account_id)
+            if from_account is None or to_account is None:
+                errors.append((index, "account not found"))
+            elif from_account.holder_id != user.holder_id:
+                errors.append((index, "account not accessible"))
+            elif from_account.id == to_account.id:
+                errors.append((index, "cannot transfer to same account"))
+            elif from_account.currency != item.currency or to_account.currency != item.currency:
+                errors.append((index, "currency mismatch"))
+            elif balances[from_account.id] < item.amount:
+                errors.append((index, "insufficient funds"))
+            else:
+                # Items are checked in order, so the batch accepts exactly what
+                # the same transfers issued one by one would have accepted.
+                balances[from_account.id] -= item.amount
+                balances[to_account.id] += item.amount
+                for account_id, type_ in (
+                    (from_account.id, "transfer_out"),
+                    (to_account.id, "transfer_in"),
+                ):
+                    transaction_rows.append(
+                        {
+                            "account_id": account_id,
+                            "type": type_,
+                            "amount": item.amount,
+                            "currency": item.currency,
+                            "balance_after": balances[account_id],
+                        }
+                    )
+        if errors:
+            raise TransferBatchError(errors)
+
+        # The batch settles atomically, so all of its rows share one timestamp.
+        created_at = utc_now()
+        touched = sorted({row["account_id"] for row in transaction_rows})
+        for row in transaction_rows:
+            row["created_at"] = created_at
+        net_changes = {
+            account_id: balances[account_id] - accounts[account_id].balance
+            for account_id in touched
+        }
+        apply_balance_changes(self._session, accounts, balances)
+        # Every touched account is locked by this transaction, so rows above the
+        # current max ids that reference them were inserted by this batch.
+        last_transfer_id, last_transaction_id = self._session.execute(
+            select(
+                select(func.coalesce(func.max(Transfer.id), 0)).scalar_subquery(),
+                select(func.coalesce(func.max(Transaction.id), 0)).scalar_subquery(),
+            )
+        ).one()
+        self._session.execute(
+            insert(Transfer),
+            [
+                {
+                    "from_account_id": item.from_account_id,
+                    "to_account_id": item.to_account_id,
+                    "amount": item.amount,
+                    "currency": item.currency,
+                    "created_at": created_at,
+                }
+                for item in items
+            ],
+        )
+        self._session.execute(insert(Transaction), transaction_rows)
+        transfers = list(
+            self._session.scalars(
+                select(Transfer)
+                .where(
+                    Transfer.id > last_transfer_id,
+                    Transfer.from_account_id.in_({item.from_account_id for item in items}),
+                )
+                .order_by(Transfer.id)
+            )
+        )
+        transaction_ids = self._session.scalars(
+            select(Transaction.id)
+            .where(Transaction.id > last_transaction_id, Transaction.account_id.in_(touched))
+            .order_by(Transaction.id)
+        )
+        for account_id in touched:
+            record_balance_snapshot(self._session, account_id, balances[account_id], created_at)
+        record_account_events(
+            self._session,
+            [
+                TransactionRow(id=transaction_id, **row)
+                for transaction_id, row in zip(transaction_ids, transaction_rows, strict=True)
+            ],
+        )
+        return TransferBatchResult(
+            transfers=transfers,
+            net_changes=net_changes,
+            balances={account_id: balances[account_id] for account_id in touched},
+        )
@@ -5,6 +5,7 @@ const state = {
   accountsByUser: {},
   expiryIntervalId: null,
   promptTimeoutId: null,
+  statementStream: null,
 };
 
 const logEl = document.getElementById("log");
@@ -193,6 +194,122 @@ async function apiRequest(method, path, body, user, extraHeaders = {}) {
   return payload;
 }
 
+function renderStatement(payload) {
+  statementOutputEl.textContent = JSON.stringify(payload, null, 2);
+}
+
+function stopStatementStream() {
+  if (state.statementStream) {
+    state.statementStream.controller.abort();
+    state.statementStream = null;
+  }
+}
+
+function applyStatementEvent(stream, message) {
+  const transaction = JSON.parse(message.data);
+  if (stream.seenIds.has(transaction.id)) {
+    return;
+  }
+  stream.seenIds.add(transaction.id);
+  // Statements list newest first.
+  stream.payload.transactions.unshift(transaction);
+  renderStatement(stream.payload);
+  log(`Live ${transaction.type} on account ${transaction.account_id}.`);
+}
+
+async function readEventStream(response, onMessage) {
+  // EventSource cannot send an Authorization header, so parse the
+  // text/event-stream body from fetch instead.
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  let message = { id: null, data: [] };
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) {
+      return;
+    }
+    buffer += value;
+    const lines = buffer.split(/\r\n|\r|\n/);
+    buffer = lines.pop();
+    for (const line of lines) {
+      if (line === "") {
+        if (message.data.length) {
+          onMessage({ id: message.id, data: message.data.join("\n") });
+        }
+        message = { id: null, data: [] };
+        continue;
+      }
+      if (line.startsWith(":")) {
+        continue;
+      }
+      const separator = line.indexOf(":");
+      const field = separator === -1 ? line : line.slice(0, separator);
+      const fieldValue = separator === -1 ? "" : line.slice(separator + 1).replace(/^ /, "");
+      if (field === "data") {
+        message.data.push(fieldValue);
+      } else if (field === "id") {
+        message.id = fieldValue;
+      } else if (field === "retry" && /^\d+$/.test(fieldValue)) {
+        onMessage({ retry: Number(fieldValue) });
+      }
+    }
+  }
+}
+
+async function runStatementStream(stream) {
+  while (!stream.controller.signal.aborted) {
+    const headers = {};
+    const user = state.users.find((entry) => entry.key === stream.userKey);
+    if (user && user.accessToken) {
+      headers.Authorization = `Bearer ${user.accessToken}`;
+    }
+    if (stream.lastEventId) {
+      headers["Last-Event-ID"] = stream.lastEventId;
+    }
+    try {
+      const response = await fetch(
+        `${state.baseUrl}/v1/accounts/${stream.accountId}/events`,
+        { headers, signal: stream.controller.signal }
+      );
+      if (!response.ok) {
+        log(`Live updates stopped (${response.status}).`);
+        return;
+      }
+      await readEventStream(response, (message) => {
+        if (message.retry != null) {
+          stream.retryMs = message.retry;
+          return;
+        }
+        stream.lastEventId = message.id;
+        applyStatementEvent(stream, message);
+      });
+    } catch (error) {
+      if (stream.controller.signal.aborted) {
+        return;
+      }
+      log(`Live updates interrupted: ${error.message}`);
+    }
+    await new Promise((resolve) => setTimeout(resolve, stream.retryMs));
+  }
+}
+
+function startStatementStream(user, accountId, payload) {
+  stopStatementStream();
+  const ids = payload.transactions.map((transaction) => transaction.id);
+  const stream = {
+    userKey: user.key,
+    accountId,
+    payload,
+    seenIds: new Set(ids),
+    // Resume from the newest row shown so nothing committed since is missed.
+    lastEventId: ids.length ? String(Math.max(...ids)) : null,
+    retryMs: 3000,
+    controller: new AbortController(),
+  };
+  state.statementStream = stream;
+  runStatementStream(stream);
+}
+
 function setActiveUser(userKey) {
   state.activeUserKey = userKey || null;
   renderUserSelectors();
@@ -431,11 +548,13 @@ document.getElementById("statement-form").addEventListener("submit", async (even
     log("Select a user before fetching a statement.");
     return;
   }
+  stopStatementStream();
   try {
     const accountId = Number(document.getElementById("statement-account").value);
     const payload = await apiRequest("GET", `/v1/statements/${accountId}`, null, user);
-    statementOutputEl.textContent = JSON.stringify(payload, null, 2);
-    log(`Statement fetched for ${user.email}.`);
+    renderStatement(payload);
+    startStatementStream(user, accountId, payload);
+    log(`Statement fetched for ${user.email}; listening for new activity.`);
   } catch (error) {
     log(error.message);
   }
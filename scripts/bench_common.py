@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core import config as app_config  # noqa: E402
+from app.core import security  # noqa: E402
+from app.core.token_cache import Principal  # noqa: E402
+from app.db import session as db_session  # noqa: E402
+from app.db.models import Account, AccountHolder, User  # noqa: E402
+
+
+def prepare_database(db_file: Path) -> str:
+    database_url = f"sqlite:///{db_file}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("APP_ENV", "test")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    app_config.get_settings.cache_clear()
+    db_session.get_engine.cache_clear()
+    os.chdir(PROJECT_ROOT)
+    db_session.run_migrations(database_url)
+    return database_url
+
+
+def seed_user_with_accounts(
+    email: str, balances: list[int], currency: str = "USD"
+) -> tuple[Principal, list[int]]:
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal.begin() as session:
+        user = User(email=email, hashed_password=security.hash_password("supersecure123"))
+        session.add(user)
+        session.flush()
+        holder = AccountHolder(
+            user_id=user.id, first_name="Bench", last_name="User", dob=date(1990, 1, 1)
+        )
+        session.add(holder)
+        session.flush()
+        accounts = [
+            Account(holder_id=holder.id, type="checking", currency=currency, balance=balance)
+            for balance in balances
+        ]
+        session.add_all(accounts)
+        session.flush()
+        principal = Principal(id=user.id, email=user.email, holder_id=holder.id)
+        return principal, [account.id for account in accounts]
+
+
+def report(label: str, operations: int, seconds: float, **extra: object) -> None:
+    rate = operations / seconds if seconds else float("inf")
+    details = " ".join(f"{key}={value}" for key, value in extra.items())
+    print(f"{label:<32} {operations:>8} ops {seconds:>8.3f}s {rate:>10.1f} ops/s {details}")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Compare commits/sec and deposits/sec for direct, serialized and group writes.
+
+Direct mode commits once per deposit on the caller's own session; serialized
+mode funnels deposits through the single writer; group mode lets the writer
+coalesce concurrently queued deposits into one commit.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from bench_common import prepare_database, report, seed_user_with_accounts
+
+from app.db import session as db_session
+from app.db.models import Account
+from app.db.writer import SerializedWriter
+from app.services.transaction_service import TransactionService
+
+
+def run(mode: str, deposits: int, workers: int, group_size: int, group_wait_ms: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare_database(Path(tmp_dir) / "bench_group_commit.db")
+        user, account_ids = seed_user_with_accounts("bench@example.com", [0] * workers)
+        SessionLocal = db_session.get_sessionmaker()
+        writer = None
+        if mode != "direct":
+            writer = SerializedWriter(
+                db_session.get_engine(),
+                queue_size=deposits,
+                group_size=group_size if mode == "group" else 1,
+                group_wait=group_wait_ms / 1000 if mode == "group" else 0.0,
+            )
+
+        def _unit(index: int):
+            def _apply(session) -> None:
+                account = session.get(Account, account_ids[index % len(account_ids)])
+                TransactionService(session).deposit(user, account, 100, "USD")
+
+            return _apply
+
+        def _deposit(index: int) -> bool:
+            try:
+                if writer is not None:
+                    writer.submit(_unit(index))
+                    return True
+                with SessionLocal() as session:
+                    db_session.begin_write_transaction(session)
+                    _unit(index)(session)
+                    session.commit()
+            except Exception:
+                return False
+            return True
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_deposit, range(deposits)))
+        elapsed = perf_counter() - start
+
+        succeeded = sum(results)
+        commits = succeeded
+        if writer is not None:
+            writer.stop()
+            commits = writer.stats()["commits"]
+        report(
+            f"{mode} workers={workers}",
+            succeeded,
+            elapsed,
+            failed=results.count(False),
+            commits=commits,
+            commits_per_s=f"{commits / elapsed:.1f}",
+        )
+        db_session.get_engine().dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modes", nargs="+", default=["direct", "serialized", "group"])
+    parser.add_argument("--deposits", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--group-size", type=int, default=64)
+    parser.add_argument("--group-wait-ms", type=float, default=2)
+    args = parser.parse_args()
+    for mode in args.modes:
+        run(mode, args.deposits, args.workers, args.group_size, args.group_wait_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compare request throughput of the BaseHTTPMiddleware and pure ASGI request loggers.
+
+Each scenario serves a trivial JSON endpoint in-process through httpx's ASGI
+transport, so the numbers isolate per-request middleware overhead.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from time import perf_counter
+from uuid import uuid4
+
+import httpx
+from bench_common import report
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from structlog.contextvars import bind_contextvars, clear_contextvars
+
+from app.core.logging import configure_logging, get_logger
+from app.core.middleware import RequestLoggingMiddleware
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app) -> None:
+        super().__init__(app)
+        self._logger = get_logger()
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        request_id = request.headers.get("X-Request-Id") or str(uuid4())
+        bind_contextvars(request_id=request_id, method=request.method, path=request.url.path)
+        start_time = perf_counter()
+        response = await call_next(request)
+        response.headers["X-Request-Id"] = request_id
+        self._logger.info(
+            "request.completed",
+            status_code=response.status_code,
+            duration_ms=int((perf_counter() - start_time) * 1000),
+        )
+        clear_contextvars()
+        return response
+
+
+def _build_app(middleware: type | None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"status": "ok"}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def _run(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one() -> None:
+            async with semaphore:
+                response = await client.get("/ping")
+                response.raise_for_status()
+
+        start = perf_counter()
+        await asyncio.gather(*(_one() for _ in range(requests)))
+        return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    configure_logging("WARNING")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    scenarios = (
+        ("no middleware", None),
+        ("BaseHTTPMiddleware (before)", LegacyRequestLoggingMiddleware),
+        ("pure ASGI (after)", RequestLoggingMiddleware),
+    )
+    for label, middleware in scenarios:
+        app = _build_app(middleware)
+        asyncio.run(_run(app, 200, args.concurrency))
+        elapsed = asyncio.run(_run(app, args.requests, args.concurrency))
+        report(label, args.requests, elapsed)
+
+
+if __name__ == "__main__":
+    main()
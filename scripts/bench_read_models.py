@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Compare per-request latency and memory of ORM entities vs slotted row DTOs for statements.
+
+Each request loads one statement page of N rows and renders it to JSON the way
+the fast response path does. The "orm" scenario selects full ``Transaction``
+entities (the previous read path); "rows" uses ``StatementService.get_statement``,
+which selects only the needed columns into ``TransactionRow`` dataclasses.
+Latency is the median of timed runs; memory is the tracemalloc peak of one run.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+from bench_common import prepare_database, seed_user_with_accounts
+from sqlalchemy import insert, select
+
+from app.core.responses import dumps, trusted_dump
+from app.db import session as db_session
+from app.db.models import Account, Transaction, utc_now
+from app.schemas.transactions import TransactionRead
+from app.services.statement_service import StatementService
+
+
+def seed_transactions(account_id: int, rows: int) -> None:
+    created_at = utc_now()
+    with db_session.get_sessionmaker().begin() as session:
+        session.execute(
+            insert(Transaction),
+            [
+                {
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": 100,
+                    "currency": "USD",
+                    "balance_after": 100 * (index + 1),
+                    "created_at": created_at,
+                }
+                for index in range(rows)
+            ],
+        )
+
+
+def orm_statement(session, user, account, limit: int) -> list[Transaction]:
+    return list(
+        session.scalars(
+            select(Transaction)
+            .where(Transaction.account_id == account.id)
+            .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+            .limit(limit + 1)
+        )
+    )[:limit]
+
+
+def row_statement(session, user, account, limit: int):
+    return StatementService(session).get_statement(user, account, limit=limit)[0]
+
+
+def request(load, user, account_id: int, limit: int) -> int:
+    with db_session.get_sessionmaker()() as session:
+        account = session.get(Account, account_id)
+        rows = load(session, user, account, limit)
+        body = dumps({"transactions": [trusted_dump(TransactionRead, row) for row in rows]})
+    return len(body)
+
+
+def measure(load, user, account_id: int, limit: int, repeats: int) -> tuple[float, float]:
+    request(load, user, account_id, limit)
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = perf_counter()
+        request(load, user, account_id, limit)
+        timings.append(perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    request(load, user, account_id, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return median(timings), peak
+
+
+def run(sizes: list[int], repeats: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare_database(Path(tmp_dir) / "bench_read_models.db")
+        user, (account_id,) = seed_user_with_accounts("bench@example.com", [0])
+        seed_transactions(account_id, max(sizes))
+        for size in sizes:
+            for label, load in (("orm", orm_statement), ("rows", row_statement)):
+                latency, peak = measure(load, user, account_id, size, repeats)
+                print(
+                    f"{label:<5} rows={size:<7} latency_ms={latency * 1000:>9.1f} "
+                    f"peak_mb={peak / 1_000_000:>7.1f}"
+                )
+        db_session.get_engine().dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
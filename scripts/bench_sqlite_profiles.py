@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Compare deposit and statement throughput across SQLite pragma profiles.
+
+Each profile is a set of SQLITE_* / DB_POOL_* overrides applied before the
+engine is created, so it exercises the same code path as the service.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from bench_common import prepare_database, report, seed_user_with_accounts
+
+from app.db import session as db_session
+from app.db.models import Account
+from app.services.statement_service import StatementService
+from app.services.transaction_service import TransactionService
+
+PROFILES = {
+    "legacy": {
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE": "-2000",
+        "SQLITE_MMAP_SIZE": "0",
+        "SQLITE_TEMP_STORE": "DEFAULT",
+        "SQLITE_WAL_AUTOCHECKPOINT": "1000",
+    },
+    "default": {},
+    "throughput": {
+        "SQLITE_SYNCHRONOUS": "NORMAL",
+        "SQLITE_CACHE_SIZE": "-131072",
+        "SQLITE_MMAP_SIZE": "1073741824",
+        "SQLITE_TEMP_STORE": "MEMORY",
+        "SQLITE_WAL_AUTOCHECKPOINT": "10000",
+    },
+}
+
+
+def run(profile: str, pool: str, deposits: int, statements: int, workers: int) -> None:
+    overrides = {**PROFILES[profile], "DB_POOL_CLASS": pool}
+    previous = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prepare_database(Path(tmp_dir) / "bench_sqlite.db")
+            user, account_ids = seed_user_with_accounts(
+                "bench@example.com", [0] * max(workers, 1)
+            )
+            SessionLocal = db_session.get_sessionmaker()
+
+            def _deposit(index: int) -> None:
+                with SessionLocal() as session:
+                    account = session.get(
+                        Account, account_ids[index % len(account_ids)]
+                    )
+                    TransactionService(session).deposit(user, account, 100, "USD")
+                    session.commit()
+
+            start = perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_deposit, range(deposits)))
+            report(f"{profile}/{pool} deposits", deposits, perf_counter() - start)
+
+            def _statement(index: int) -> None:
+                with SessionLocal() as session:
+                    account = session.get(
+                        Account, account_ids[index % len(account_ids)]
+                    )
+                    StatementService(session).get_statement(user, account, limit=100)
+
+            start = perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_statement, range(statements)))
+            report(f"{profile}/{pool} statements", statements, perf_counter() - start)
+            db_session.get_engine().dispose()
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--pools", nargs="+", default=["queue", "null"])
+    parser.add_argument("--deposits", type=int, default=2000)
+    parser.add_argument("--statements", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    for profile in args.profiles:
+        for pool in args.pools:
+            run(profile, pool, args.deposits, args.statements, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare CPU time per request for a 10k-row statement, standard vs fast JSON path.
+
+The standard path validates every row into ``TransactionRead`` and renders with
+``json``; the fast path (``FAST_JSON_RESPONSES=true``) copies schema fields from
+the loaded rows and renders with orjson. Both go through
+the real route, including the database read.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter, process_time
+
+import orjson
+from bench_common import prepare_database, report, seed_user_with_accounts
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.core import config as app_config
+from app.core import security
+from app.db import session as db_session
+from app.db.models import Transaction, utc_now
+from app.services import statement_service
+
+
+def seed_transactions(account_id: int, rows: int) -> None:
+    created_at = utc_now()
+    with db_session.get_sessionmaker().begin() as session:
+        session.execute(
+            insert(Transaction),
+            [
+                {
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": 100,
+                    "currency": "USD",
+                    "balance_after": 100 * (index + 1),
+                    "created_at": created_at,
+                }
+                for index in range(rows)
+            ],
+        )
+
+
+def run(rows: int, requests: int) -> None:
+    # Let a single page hold the whole statement; must happen before the
+    # routes are imported, since the limit is bound into the query validator.
+    statement_service.MAX_STATEMENT_LIMIT = rows
+    from app.main import create_app
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare_database(Path(tmp_dir) / "bench_statement_serialization.db")
+        user, (account_id,) = seed_user_with_accounts("bench@example.com", [100 * rows])
+        seed_transactions(account_id, rows)
+        token, _ = security.create_access_token(user.id, user.email, user.holder_id)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for mode, fast in (("standard", "false"), ("fast", "true")):
+            os.environ["FAST_JSON_RESPONSES"] = fast
+            app_config.get_settings.cache_clear()
+            with TestClient(create_app()) as client:
+                url = f"/v1/statements/{account_id}?limit={rows}"
+                response = client.get(url, headers=headers)
+                assert len(response.json()["transactions"]) == rows
+                cpu_start, wall_start = process_time(), perf_counter()
+                for _ in range(requests):
+                    client.get(url, headers=headers)
+                cpu = process_time() - cpu_start
+                wall = perf_counter() - wall_start
+            renderer = f"orjson-{orjson.__version__}" if fast == "true" else "json"
+            report(
+                f"{mode} rows={rows}",
+                requests,
+                wall,
+                renderer=renderer,
+                cpu_ms_per_request=f"{cpu / requests * 1000:.1f}",
+                body_bytes=len(response.content),
+            )
+        db_session.get_engine().dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    run(args.rows, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Measure transfer throughput under contention.
+
+Workers alternate A->B and B->A transfers between the same two accounts, which
+is the pattern that deadlocks without deterministic lock ordering.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from bench_common import prepare_database, report, seed_user_with_accounts
+
+from app.db import session as db_session
+from app.services.transfer_service import TransferService
+
+
+def run(transfers: int, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare_database(Path(tmp_dir) / "bench_transfers.db")
+        user, (first_id, second_id) = seed_user_with_accounts(
+            "bench@example.com", [10**9, 10**9]
+        )
+        SessionLocal = db_session.get_sessionmaker()
+
+        def _transfer(index: int) -> bool:
+            source, target = (first_id, second_id) if index % 2 else (second_id, first_id)
+            with SessionLocal() as session:
+                try:
+                    service = TransferService(session)
+                    accounts = service.lock_accounts(source, target)
+                    service.transfer(user, accounts[source], accounts[target], 1, "USD")
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    return False
+            return True
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_transfer, range(transfers)))
+        elapsed = perf_counter() - start
+
+        report(
+            f"transfers workers={workers}",
+            sum(results),
+            elapsed,
+            failed=results.count(False),
+        )
+        db_session.get_engine().dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transfers", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+    for workers in args.workers:
+        run(args.transfers, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from contextlib import suppress
+from datetime import date
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+from app.core.token_cache import Principal
+from app.db import session as db_session
+from app.db.models import Account, AccountHolder, Transaction
+from app.db.session import defer_until_committed
+from app.db.writer import SerializedWriter
+from app.main import create_app
+from app.services import account_events
+from app.services.account_events import AccountEventBroker, iter_account_events
+from app.services.transaction_service import TransactionService
+from tests.integration.utils import apply_migrations, configure_test_db, create_user, login, signup
+
+
+def _seed(tmp_path: Path, monkeypatch, name: str) -> tuple[Principal, int]:
+    database_url = configure_test_db(tmp_path, monkeypatch, name)
+    apply_migrations(database_url)
+    with db_session.get_sessionmaker().begin() as session:
+        user = create_user(session, "ada@example.com", "supersecure123")
+        holder = AccountHolder(
+            user_id=user.id, first_name="Ada", last_name="Lovelace", dob=date(1990, 1, 1)
+        )
+        session.add(holder)
+        session.flush()
+        account = Account(holder_id=holder.id, type="checking", currency="USD", balance=0)
+        session.add(account)
+        session.flush()
+        return Principal(id=user.id, email=user.email, holder_id=holder.id), account.id
+
+
+def _deposit(principal: Principal, account_id: int, amount: int, commit: bool = True) -> None:
+    with db_session.get_sessionmaker()() as session:
+        account = session.get(Account, account_id)
+        TransactionService(session).deposit(principal, account, amount, "USD")
+        if commit:
+            session.commit()
+        else:
+            session.rollback()
+
+
+def _events(chunks: list[str]) -> list[dict]:
+    return [
+        json.loads(line.removeprefix("data: "))
+        for chunk in chunks
+        for line in chunk.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def test_committed_transactions_are_published(tmp_path: Path, monkeypatch) -> None:
+    principal, account_id = _seed(tmp_path, monkeypatch, "events-publish")
+    broker = AccountEventBroker(buffer_size=10)
+    monkeypatch.setattr(account_events, "get_account_events", lambda: broker)
+
+    async def scenario() -> list:
+        subscription = broker.subscribe(account_id)
+        await asyncio.to_thread(_deposit, principal, account_id, 70, False)
+        await asyncio.to_thread(_deposit, principal, account_id, 30)
+        received = [await subscription.next(1), await subscription.next(0.05)]
+        broker.unsubscribe(subscription)
+        return received
+
+    first, second = asyncio.run(scenario())
+    assert second is None
+    assert first.encode().startswith(f"id: {first.id}\nevent: transaction\ndata: ")
+    assert json.loads(first.data)["amount"] == 30
+    assert broker.subscriber_count() == 0
+
+
+def test_group_commit_publishes_after_shared_commit(tmp_path: Path, monkeypatch) -> None:
+    principal, account_id = _seed(tmp_path, monkeypatch, "events-group")
+    broker = AccountEventBroker(buffer_size=10)
+    monkeypatch.setattr(account_events, "get_account_events", lambda: broker)
+    writer = SerializedWriter(db_session.get_engine(), queue_size=10, group_size=8)
+
+    def _unit(amount: int):
+        def _apply(session) -> None:
+            account = session.get(Account, account_id)
+            TransactionService(session).deposit(principal, account, amount, "USD")
+            if amount < 0:
+                raise ValueError("rejected")
+
+        return _apply
+
+    async def scenario() -> list[int]:
+        subscription = broker.subscribe(account_id)
+        await asyncio.to_thread(writer.submit, _unit(5))
+        with suppress(ValueError):
+            await asyncio.to_thread(writer.submit, _unit(-1))
+        received = []
+        while (account_event := await subscription.next(0.2)) is not None:
+            received.append(json.loads(account_event.data)["amount"])
+        return received
+
+    try:
+        assert asyncio.run(scenario()) == [5]
+    finally:
+        writer.stop()
+
+
+def test_publish_failures_do_not_fail_committed_writes(tmp_path: Path, monkeypatch) -> None:
+    principal, account_id = _seed(tmp_path, monkeypatch, "events-publish-failure")
+    broker = AccountEventBroker(buffer_size=10)
+
+    def _fail(rows) -> None:
+        raise TypeError("cannot serialize")
+
+    monkeypatch.setattr(broker, "publish", _fail)
+    monkeypatch.setattr(account_events, "get_account_events", lambda: broker)
+    _deposit(principal, account_id, 10)
+
+    writer = SerializedWriter(db_session.get_engine(), queue_size=10, group_size=8)
+
+    def _apply(session) -> int:
+        account = session.get(Account, account_id)
+        transaction = TransactionService(session).deposit(principal, account, 20, "USD")
+        defer_until_committed(session, lambda: 1 / 0)
+        return transaction.balance_after
+
+    try:
+        assert writer.submit(_apply) == 30
+        # The writer survives and keeps serving units.
+        assert writer.submit(lambda _session: "next") == "next"
+    finally:
+        writer.stop()
+
+    with db_session.get_sessionmaker()() as session:
+        assert session.query(Transaction).filter_by(account_id=account_id).count() == 2
+
+
+def test_stream_resumes_from_last_event_id_and_recovers_from_overflow(
+    tmp_path: Path, monkeypatch
+) -> None:
+    principal, account_id = _seed(tmp_path, monkeypatch, "events-resume")
+    broker = AccountEventBroker(buffer_size=1)
+    monkeypatch.setattr(account_events, "get_account_events", lambda: broker)
+    for amount in (1, 2, 3):
+        _deposit(principal, account_id, amount)
+    engine = db_session.get_engine()
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        stream = iter_account_events(broker, account_id, engine, heartbeat=0.05, last_event_id=1)
+        resumed = [await anext(stream) for _ in range(3)]
+        keep_alive = await anext(stream)
+        # Three commits overflow the one-slot buffer; the stream reads them back.
+        for amount in (4, 5, 6):
+            await asyncio.to_thread(_deposit, principal, account_id, amount)
+        await asyncio.sleep(0.05)
+        recovered = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+        return resumed + [keep_alive], recovered
+
+    resumed, recovered = asyncio.run(scenario())
+    assert resumed[0] == "retry: 3000\n\n"
+    assert [event["amount"] for event in _events(resumed[1:3])] == [2, 3]
+    assert resumed[3] == ": keep-alive\n\n"
+    assert [event["amount"] for event in _events(recovered)] == [4, 5, 6]
+    assert broker.subscriber_count() == 0
+
+
+def test_events_endpoint_streams_deposits(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "events-http")
+    apply_migrations(database_url)
+    monkeypatch.setenv("SSE_HEARTBEAT_SECONDS", "0.2")
+    from app.core import config as app_config
+
+    app_config.get_settings.cache_clear()
+    account_events.get_account_events.cache_clear()
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(), host="127.0.0.1", port=0, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        thread.join(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=5) as client:
+            signup(client, "ada@example.com", "supersecure123")
+            tokens = login(client, "ada@example.com", "supersecure123")
+            headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+            account_id = client.post(
+                "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+            ).json()["id"]
+            assert client.get("/v1/accounts/9999/events", headers=headers).status_code == 404
+            invalid = client.get(
+                f"/v1/accounts/{account_id}/events",
+                headers={**headers, "Last-Event-ID": "abc"},
+            )
+            assert invalid.status_code == 400
+
+            with client.stream("GET", f"/v1/accounts/{account_id}/events", headers=headers) as (
+                stream
+            ):
+                assert stream.headers["content-type"].startswith("text/event-stream")
+                lines = stream.iter_lines()
+                assert next(lines) == "retry: 3000"
+                client.post(
+                    "/v1/transactions",
+                    headers=headers,
+                    json={
+                        "account_id": account_id,
+                        "type": "deposit",
+                        "amount": 125,
+                        "currency": "USD",
+                    },
+                )
+                data = next(line for line in lines if line.startswith("data: "))
+                assert json.loads(data.removeprefix("data: "))["balance_after"] == 125
+    finally:
+        server.should_exit = True
+        thread.join(5)
+        account_events.get_account_events.cache_clear()
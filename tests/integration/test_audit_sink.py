@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlalchemy import event, func, select
+
+from app.db import session as db_session
+from app.db.models import AuditLog
+from app.services.audit_sink import AuditSink
+from tests.integration.utils import apply_migrations, configure_test_db
+
+
+def _event(index: int = 0) -> dict:
+    return {
+        "user_id": None,
+        "event_type": "login",
+        "status": "failure",
+        "ip_address": "127.0.0.1",
+        "device_id": f"device-{index}",
+        "metadata": {"attempt": index},
+    }
+
+
+def _audit_count() -> int:
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal() as session:
+        return session.scalar(select(func.count()).select_from(AuditLog))
+
+
+def test_async_sink_batches_inserts(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "audit-batch")
+    apply_migrations(database_url)
+    engine = db_session.get_engine()
+    batch_sizes: list[int] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO audit_logs"):
+            batch_sizes.append(len(parameters) if executemany else 1)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    sink = AuditSink(batch_size=4, flush_interval=60)
+    sink.start()
+    try:
+        for index in range(10):
+            sink.emit(**_event(index))
+        sink.flush()
+        assert _audit_count() == 10
+    finally:
+        sink.stop()
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+    assert batch_sizes == [4, 4, 2]
+
+
+def test_async_sink_drains_on_stop(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "audit-drain")
+    apply_migrations(database_url)
+    sink = AuditSink(batch_size=1000, flush_interval=60)
+    sink.start()
+    for index in range(25):
+        sink.emit(**_event(index))
+    sink.stop()
+
+    assert not sink.running
+    assert _audit_count() == 25
+
+
+def test_async_sink_writes_session_events_only_after_commit(
+    tmp_path: Path, monkeypatch
+) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "audit-commit")
+    apply_migrations(database_url)
+    monkeypatch.setattr("app.services.audit_sink.get_audit_sink", lambda: sink)
+    sink = AuditSink(batch_size=1000, flush_interval=60)
+    sink.start()
+    SessionLocal = db_session.get_sessionmaker()
+    try:
+        with SessionLocal() as session:
+            sink.record(session, **_event(1))
+            session.rollback()
+        with SessionLocal() as session:
+            sink.record(session, **_event(2))
+            assert sink.queue_depth() == 0
+            session.commit()
+        sink.flush()
+    finally:
+        sink.stop()
+
+    with SessionLocal() as session:
+        rows = list(session.scalars(select(AuditLog)))
+    assert [row.device_id for row in rows] == ["device-2"]
+
+
+def test_sync_sink_writes_inline(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "audit-sync")
+    apply_migrations(database_url)
+    sink = AuditSink(mode="sync")
+    sink.start()
+    assert not sink.running
+
+    sink.emit(**_event(1))
+    assert _audit_count() == 1
+
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal() as session:
+        sink.record(session, **_event(2))
+        session.flush()
+        assert session.scalar(select(func.count()).select_from(AuditLog)) == 2
+        session.rollback()
+    assert _audit_count() == 1
@@ -4,8 +4,10 @@ from alembic import command
 from alembic.config import Config
 from fastapi.testclient import TestClient
 
+from app.api import deps
 from app.core import config as app_config
 from app.core import security
+from app.core.token_cache import get_token_cache
 from app.db import session as db_session
 from app.db.models import AuditLog, RefreshToken, User
 from app.main import create_app
@@ -211,3 +213,37 @@ def test_expired_refresh_token_is_revoked(tmp_path: Path, monkeypatch) -> None:
             token_hash=security.hash_refresh_token(refresh_token)
         ).one()
         assert refresh_row.revoked_at is not None
+
+
+def test_authenticated_requests_reuse_cached_principal(tmp_path: Path, monkeypatch) -> None:
+    database_url = _configure_test_db(tmp_path, monkeypatch)
+    _apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        _signup(client, "ada@example.com", "supersecure123")
+        login_response = client.post(
+            "/v1/auth/login",
+            json={"email": "ada@example.com", "password": "supersecure123"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        first = client.get("/v1/auth/me", headers=headers)
+        assert first.status_code == 200
+
+        def _fail_decode(_token: str) -> dict:
+            raise AssertionError("token should be served from cache")
+
+        monkeypatch.setattr(deps, "decode_access_token", _fail_decode)
+        hits_before = get_token_cache().stats()["hits"]
+        second = client.get("/v1/auth/me", headers=headers)
+        assert second.status_code == 200
+        assert second.json()["email"] == "ada@example.com"
+        assert get_token_cache().stats()["hits"] == hits_before + 1
+
+        monkeypatch.setattr(deps, "decode_access_token", security.decode_access_token)
+        tampered = client.get(
+            "/v1/auth/me",
+            headers={"Authorization": headers["Authorization"][:-2] + "xx"},
+        )
+        assert tampered.status_code == 401
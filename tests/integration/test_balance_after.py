@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import select, text
+
+from app.db import session as db_session
+from app.db.backfill import backfill_balance_after
+from app.db.models import Transaction
+from tests.integration.utils import configure_test_db
+
+
+def test_backfill_fills_running_balances(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "balance-after-backfill")
+    config = Config("alembic.ini")
+    config.set_main_option("script_location", "app/db/migrations")
+    config.set_main_option("sqlalchemy.url", database_url)
+    command.upgrade(config, "0005_balance_snapshots")
+
+    engine = db_session.get_engine()
+    history = {
+        1: [("deposit", 100), ("withdrawal", 30), ("transfer_in", 5)],
+        2: [("deposit", 70), ("transfer_out", 20)],
+        3: [("deposit", 10)],
+    }
+    with engine.begin() as connection:
+        for account_id, entries in history.items():
+            for index, (type_, amount) in enumerate(entries):
+                connection.execute(
+                    text(
+                        "INSERT INTO transactions (account_id, type, amount, currency, created_at) "
+                        "VALUES (:account_id, :type, :amount, 'USD', :created_at)"
+                    ),
+                    {
+                        "account_id": account_id,
+                        "type": type_,
+                        "amount": amount,
+                        "created_at": f"2024-01-0{index + 1} 00:00:00.000000",
+                    },
+                )
+    command.upgrade(config, "head")
+
+    assert backfill_balance_after(engine, workers=2, chunk_size=1) == 6
+    assert backfill_balance_after(engine, workers=2, chunk_size=1) == 0
+
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(Transaction.account_id, Transaction.balance_after).order_by(Transaction.id)
+        ).all()
+    assert rows == [(1, 100), (1, 70), (1, 75), (2, 70), (2, 50), (3, 10)]
@@ -0,0 +1,132 @@
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import create_mock_engine, select, text
+from sqlalchemy.orm import Session
+
+from app.db import session as db_session
+from app.db.models import BalanceSnapshot
+from app.main import create_app
+from app.services.balance_service import BalanceService
+from app.services.balances import record_balance_snapshot
+from tests.integration.utils import apply_migrations, configure_test_db, login, signup
+
+
+def test_balance_as_of_uses_snapshots_and_delta(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "balance-as-of")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        account_id = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        for type_, amount in (("deposit", 500), ("withdrawal", 120), ("deposit", 40)):
+            client.post(
+                "/v1/transactions",
+                headers=headers,
+                json={"account_id": account_id, "type": type_, "amount": amount, "currency": "USD"},
+            )
+        statement = client.get(f"/v1/statements/{account_id}", headers=headers).json()
+        second_at = statement["transactions"][1]["created_at"]
+
+        def balance(as_of: str | None = None) -> int:
+            params = {"as_of": as_of} if as_of else {}
+            response = client.get(
+                f"/v1/accounts/{account_id}/balance", headers=headers, params=params
+            )
+            assert response.status_code == 200
+            return response.json()["balance"]
+
+        tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        assert balance() == 420
+        assert balance(second_at) == 380
+        assert balance(tomorrow) == 420
+        assert balance(yesterday) == 0
+
+        missing = client.get("/v1/accounts/9999/balance", headers=headers)
+        assert missing.status_code == 404
+        signup(client, "grace@example.com", "supersecure123")
+        grace = login(client, "grace@example.com", "supersecure123")
+        foreign = client.get(
+            f"/v1/accounts/{account_id}/balance",
+            headers={"Authorization": f"Bearer {grace['access_token']}"},
+        )
+        assert foreign.status_code == 403
+
+        period = client.get(
+            f"/v1/statements/{account_id}",
+            headers=headers,
+            params={"start": second_at, "end": tomorrow},
+        ).json()
+        assert period["opening_balance"] == 500
+        assert period["closing_balance"] == 420
+
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal() as session:
+        snapshots = list(session.scalars(select(BalanceSnapshot)))
+    assert [(row.account_id, row.balance) for row in snapshots] == [(account_id, 420)]
+
+
+def test_migration_backfills_daily_snapshots(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "balance-backfill")
+    config = Config("alembic.ini")
+    config.set_main_option("script_location", "app/db/migrations")
+    config.set_main_option("sqlalchemy.url", database_url)
+    command.upgrade(config, "0004_lookup_indexes")
+
+    engine = db_session.get_engine()
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO accounts (id, holder_id, type, currency, balance, status, created_at) "
+                "VALUES (1, 1, 'checking', 'USD', 120, 'active', '2024-01-01 00:00:00')"
+            )
+        )
+        for created_at, type_, amount in (
+            ("2024-01-01 09:00:00.000000", "deposit", 100),
+            ("2024-01-01 17:00:00.000000", "transfer_in", 50),
+            ("2024-01-03 12:00:00.000000", "withdrawal", 30),
+        ):
+            connection.execute(
+                text(
+                    "INSERT INTO transactions (account_id, type, amount, currency, created_at) "
+                    "VALUES (1, :type, :amount, 'USD', :created_at)"
+                ),
+                {"type": type_, "amount": amount, "created_at": created_at},
+            )
+
+    command.upgrade(config, "head")
+
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal() as session:
+        snapshots = session.execute(
+            select(BalanceSnapshot.snapshot_date, BalanceSnapshot.balance).order_by(
+                BalanceSnapshot.snapshot_date
+            )
+        ).all()
+        assert snapshots == [(date(2024, 1, 1), 150), (date(2024, 1, 3), 120)]
+
+        service = BalanceService(session)
+        assert service.balance_at(1, datetime(2024, 1, 1, 12, tzinfo=timezone.utc)) == 100
+        assert service.balance_at(1, datetime(2024, 1, 2, tzinfo=timezone.utc)) == 150
+        assert service.balance_at(1, datetime(2024, 1, 3, 11, tzinfo=timezone.utc)) == 150
+        assert service.balance_at(1, datetime(2024, 1, 3, 12, tzinfo=timezone.utc)) == 120
+        assert (
+            service.balance_at(1, datetime(2024, 1, 3, 12, tzinfo=timezone.utc), inclusive=False)
+            == 150
+        )
+
+
+def test_snapshot_upsert_rejects_unsupported_dialects() -> None:
+    engine = create_mock_engine("mysql://", executor=lambda *args, **kwargs: None)
+    with pytest.raises(RuntimeError, match="not supported on mysql"):
+        record_balance_snapshot(Session(bind=engine), 1, 100, datetime.now(timezone.utc))
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+from app.db import session as db_session
+from app.core.token_cache import Principal
+from app.db.models import Account, AccountHolder, Transaction
+from app.services.transaction_service import TransactionService
+from app.services.transfer_service import TransferService
+from tests.integration.utils import apply_migrations, configure_test_db, create_user
+
+
+def _seed_accounts(*balances: int) -> tuple[Principal, list[int]]:
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal.begin() as session:
+        user = create_user(session, "ada@example.com", "supersecure123")
+        holder = AccountHolder(
+            user_id=user.id, first_name="Ada", last_name="Lovelace", dob=date(1990, 1, 1)
+        )
+        session.add(holder)
+        session.flush()
+        accounts = [
+            Account(holder_id=holder.id, type="checking", currency="USD", balance=balance)
+            for balance in balances
+        ]
+        session.add_all(accounts)
+        session.flush()
+        principal = Principal(id=user.id, email=user.email, holder_id=holder.id)
+        return principal, [account.id for account in accounts]
+
+
+def test_concurrent_withdrawals_never_overdraw(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "concurrency")
+    apply_migrations(database_url)
+    user, (account_id,) = _seed_accounts(1000)
+    SessionLocal = db_session.get_sessionmaker()
+
+    def _withdraw(_: int) -> bool:
+        with SessionLocal() as session:
+            account = session.get(Account, account_id)
+            try:
+                TransactionService(session).withdraw(user, account, 10, "USD")
+            except ValueError:
+                session.rollback()
+                return False
+            session.commit()
+            return True
+
+    def _deposit(_: int) -> None:
+        with SessionLocal() as session:
+            account = session.get(Account, account_id)
+            TransactionService(session).deposit(user, account, 5, "USD")
+            session.commit()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        withdrawals = executor.map(_withdraw, range(200))
+        deposits = list(executor.map(_deposit, range(40)))
+        succeeded = sum(1 for ok in withdrawals if ok)
+
+    with SessionLocal() as session:
+        balance = session.get(Account, account_id).balance
+        withdrawal_count = session.scalar(
+            select(func.count())
+            .select_from(Transaction)
+            .where(Transaction.account_id == account_id, Transaction.type == "withdrawal")
+        )
+
+    assert balance >= 0
+    assert withdrawal_count == succeeded
+    assert balance == 1000 + 5 * len(deposits) - 10 * succeeded
+    assert 100 <= succeeded <= 120
+
+
+def test_opposing_transfers_do_not_deadlock(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "opposing-transfers")
+    apply_migrations(database_url)
+    user, (first_id, second_id) = _seed_accounts(500, 500)
+    SessionLocal = db_session.get_sessionmaker()
+
+    def _transfer(index: int) -> None:
+        source, target = (first_id, second_id) if index % 2 else (second_id, first_id)
+        with SessionLocal() as session:
+            service = TransferService(session)
+            accounts = service.lock_accounts(source, target)
+            service.transfer(user, accounts[source], accounts[target], 7, "USD")
+            session.commit()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_transfer, range(100)))
+
+    with SessionLocal() as session:
+        balances = {
+            account.id: account.balance
+            for account in session.scalars(select(Account).order_by(Account.id))
+        }
+        transfer_rows = session.scalar(select(func.count()).select_from(Transaction))
+
+    assert balances == {first_id: 500, second_id: 500}
+    assert transfer_rows == 200
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from tests.integration.utils import (
+    apply_migrations,
+    configure_test_db,
+    login,
+    query_budget,
+    signup,
+)
+
+
+def _deposit(client: TestClient, headers: dict, account_id: int, amount: int) -> None:
+    response = client.post(
+        "/v1/transactions",
+        headers=headers,
+        json={"account_id": account_id, "type": "deposit", "amount": amount, "currency": "USD"},
+    )
+    assert response.status_code == 201
+
+
+def test_statement_etag_short_circuits_unchanged_polls(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "etag-statement")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        account_id = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        _deposit(client, headers, account_id, 100)
+
+        first = client.get(f"/v1/statements/{account_id}", headers=headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        with query_budget(1):
+            unchanged = client.get(
+                f"/v1/statements/{account_id}", headers={**headers, "If-None-Match": etag}
+            )
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["ETag"] == etag
+
+        paged = client.get(
+            f"/v1/statements/{account_id}?limit=1", headers={**headers, "If-None-Match": etag}
+        )
+        assert paged.status_code == 200
+        assert paged.headers["ETag"] != etag
+
+        # A deposit and an equal withdrawal leave the balance unchanged but
+        # still produce a new version.
+        _deposit(client, headers, account_id, 25)
+        client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": account_id, "type": "withdrawal", "amount": 25, "currency": "USD"},
+        )
+        changed = client.get(
+            f"/v1/statements/{account_id}", headers={**headers, "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert len(changed.json()["transactions"]) == 3
+
+        missing = client.get("/v1/statements/9999", headers={**headers, "If-None-Match": "*"})
+        assert missing.status_code == 404
+
+
+def test_account_list_etag_tracks_balances(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "etag-accounts")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        account_id = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+
+        first = client.get("/v1/accounts", headers=headers)
+        etag = first.headers["ETag"]
+        unchanged = client.get(
+            "/v1/accounts", headers={**headers, "If-None-Match": f'"other", {etag}'}
+        )
+        assert unchanged.status_code == 304
+
+        _deposit(client, headers, account_id, 10)
+        changed = client.get("/v1/accounts", headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()[0]["balance"] == 10
+        assert changed.headers["ETag"] != etag
@@ -3,7 +3,9 @@ from pathlib import Path
 from alembic import command
 from alembic.config import Config
 from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool
 
+from app.core import config as app_config
 from app.db import session as db_session
 
 
@@ -33,3 +35,35 @@ def test_alembic_migration_applies_to_empty_db(tmp_path: Path) -> None:
             )
         )
         assert result.fetchone() is not None
+
+
+def test_sqlite_pragmas_and_pool_follow_settings(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    monkeypatch.setenv("SQLITE_CACHE_SIZE", "-4096")
+    monkeypatch.setenv("SQLITE_MMAP_SIZE", "1048576")
+    monkeypatch.setenv("SQLITE_TEMP_STORE", "MEMORY")
+    monkeypatch.setenv("SQLITE_WAL_AUTOCHECKPOINT", "5000")
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    settings = app_config.AppSettings()
+    engine = db_session.create_engine_from_url(
+        f"sqlite:///{tmp_path / 'pragmas.db'}", settings=settings
+    )
+
+    with engine.connect() as connection:
+        def pragma(name: str) -> object:
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1
+        assert pragma("cache_size") == -4096
+        assert pragma("mmap_size") == 1048576
+        assert pragma("temp_store") == 2
+        assert pragma("wal_autocheckpoint") == 5000
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 3
+
+    monkeypatch.setenv("DB_POOL_CLASS", "null")
+    null_engine = db_session.create_engine_from_url(
+        f"sqlite:///{tmp_path / 'null-pool.db'}", settings=app_config.AppSettings()
+    )
+    assert isinstance(null_engine.pool, NullPool)
@@ -2,8 +2,9 @@ from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from app.core.hashing import PasswordHashingBusyError, get_password_hasher
 from app.main import create_app
-from tests.integration.utils import apply_migrations, configure_test_db
+from tests.integration.utils import apply_migrations, configure_test_db, signup
 
 
 def _setup_app(tmp_path: Path, monkeypatch) -> TestClient:
@@ -40,3 +41,20 @@ def test_auth_error_envelope(tmp_path: Path, monkeypatch) -> None:
     payload = response.json()
     assert payload["error"]["code"] == "unauthorized"
     assert payload["error"]["message"] == "Unauthorized"
+
+
+def test_login_returns_503_when_hashing_saturated(tmp_path: Path, monkeypatch) -> None:
+    def _saturated(*_args):
+        raise PasswordHashingBusyError(retry_after=2)
+
+    with _setup_app(tmp_path, monkeypatch) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        monkeypatch.setattr(get_password_hasher(), "run", _saturated)
+        response = client.post(
+            "/v1/auth/login",
+            json={"email": "ada@example.com", "password": "supersecure123"},
+        )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert response.json()["error"]["code"] == "service_unavailable"
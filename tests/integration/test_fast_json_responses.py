@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.core import config as app_config
+from app.main import create_app
+from tests.integration.utils import apply_migrations, configure_test_db, login, signup
+
+
+def _read_all(client: TestClient, headers: dict, account_id: int) -> dict:
+    statement = client.get(f"/v1/statements/{account_id}", headers=headers)
+    accounts = client.get("/v1/accounts", headers=headers)
+    account = client.get(f"/v1/accounts/{account_id}", headers=headers)
+    for response in (statement, accounts, account):
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+    assert statement.headers["ETag"] and accounts.headers["ETag"]
+    body = statement.json()
+    body.pop("generated_at")
+    return {
+        "statement": body,
+        "statement_etag": statement.headers["ETag"],
+        "accounts": accounts.json(),
+        "account": account.json(),
+    }
+
+
+def test_fast_json_reads_match_validated_responses(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "fast-json")
+    apply_migrations(database_url)
+
+    with TestClient(create_app()) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        account_id = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        for amount in (100, 250):
+            client.post(
+                "/v1/transactions",
+                headers=headers,
+                json={
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": amount,
+                    "currency": "USD",
+                },
+            )
+        standard = _read_all(client, headers, account_id)
+
+    monkeypatch.setenv("FAST_JSON_RESPONSES", "true")
+    app_config.get_settings.cache_clear()
+    with TestClient(create_app()) as client:
+        fast = _read_all(client, headers, account_id)
+        created = client.post(
+            "/v1/accounts", headers=headers, json={"type": "savings", "currency": "USD"}
+        )
+        assert created.status_code == 201
+        assert created.json()["type"] == "savings"
+
+    assert fast == standard
+    assert len(fast["statement"]["transactions"]) == 2
@@ -28,3 +28,4 @@ def test_health_endpoint_returns_expected_schema(tmp_path: Path, monkeypatch) ->
     assert payload["status"] == "ok"
     assert payload["database"] == "ok"
     assert "timestamp" in payload
+    assert payload["password_hashing"]["queue_depth"] == 0
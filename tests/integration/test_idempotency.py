@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select, update
+
+from app.core import config as app_config
+from app.db import session as db_session
+from app.db.models import IdempotencyKey, Transaction, utc_now
+from app.db.writer import get_db_writer
+from app.main import create_app
+from app.services.idempotency import IdempotencyService
+from tests.integration.utils import (
+    apply_migrations,
+    configure_test_db,
+    login,
+    query_budget,
+    signup,
+)
+
+
+def _setup(client: TestClient) -> tuple[dict, int, int]:
+    signup(client, "ada@example.com", "supersecure123")
+    tokens = login(client, "ada@example.com", "supersecure123")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    checking, savings = (
+        client.post(
+            "/v1/accounts", headers=headers, json={"type": account_type, "currency": "USD"}
+        ).json()["id"]
+        for account_type in ("checking", "savings")
+    )
+    return headers, checking, savings
+
+
+def _transaction_count() -> int:
+    with db_session.get_sessionmaker()() as session:
+        return session.scalar(select(func.count()).select_from(Transaction))
+
+
+def test_retried_deposit_is_replayed_from_stored_response(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "idempotent-deposit")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, checking, _ = _setup(client)
+        request = {
+            "headers": {**headers, "Idempotency-Key": str(uuid4())},
+            "json": {"account_id": checking, "type": "deposit", "amount": 500, "currency": "USD"},
+        }
+        first = client.post("/v1/transactions", **request)
+        assert first.status_code == 201
+        assert "Idempotent-Replayed" not in first.headers
+
+        with query_budget(1):
+            second = client.post("/v1/transactions", **request)
+        with query_budget(0):
+            third = client.post("/v1/transactions", **request)
+        for retry in (second, third):
+            assert retry.status_code == 201
+            assert retry.headers["Idempotent-Replayed"] == "true"
+            assert retry.json() == first.json()
+
+        assert client.get(f"/v1/accounts/{checking}", headers=headers).json()["balance"] == 500
+        assert _transaction_count() == 1
+
+        reused = client.post(
+            "/v1/transactions",
+            headers=request["headers"],
+            json={**request["json"], "amount": 501},
+        )
+        assert reused.status_code == 422
+        assert reused.json()["error"]["message"] == (
+            "idempotency key reused with a different request"
+        )
+
+
+def test_failed_transfer_is_not_stored(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "idempotent-transfer")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, checking, savings = _setup(client)
+        request = {
+            "headers": {**headers, "Idempotency-Key": str(uuid4())},
+            "json": {
+                "from_account_id": checking,
+                "to_account_id": savings,
+                "amount": 300,
+                "currency": "USD",
+            },
+        }
+        rejected = client.post("/v1/transfers", **request)
+        assert rejected.status_code == 400
+
+        client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": checking, "type": "deposit", "amount": 1000, "currency": "USD"},
+        )
+        first = client.post("/v1/transfers", **request)
+        second = client.post("/v1/transfers", **request)
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert client.get(f"/v1/accounts/{checking}", headers=headers).json()["balance"] == 700
+
+        too_long = client.post(
+            "/v1/transfers",
+            headers={**headers, "Idempotency-Key": "k" * 256},
+            json=request["json"],
+        )
+        assert too_long.status_code == 422
+
+
+def test_concurrent_duplicate_replays_committed_response(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "idempotent-race")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, checking, _ = _setup(client)
+        request = {
+            "headers": {**headers, "Idempotency-Key": str(uuid4())},
+            "json": {"account_id": checking, "type": "deposit", "amount": 50, "currency": "USD"},
+        }
+        first = client.post("/v1/transactions", **request)
+
+        # Simulate a retry that checked for the key before the first request
+        # committed: the insert conflicts and the stored response is returned.
+        lookup = IdempotencyService.lookup
+        misses = iter([True])
+        monkeypatch.setattr(
+            IdempotencyService,
+            "lookup",
+            lambda self, *args: None if next(misses, False) else lookup(self, *args),
+        )
+        second = client.post("/v1/transactions", **request)
+        assert second.status_code == 201
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert second.json() == first.json()
+        assert _transaction_count() == 1
+
+
+def test_group_commit_duplicate_replays_unit_committed_with_it(
+    tmp_path: Path, monkeypatch
+) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "idempotent-group-race")
+    apply_migrations(database_url)
+    monkeypatch.setenv("WRITE_MODE", "group")
+    monkeypatch.setenv("WRITE_GROUP_MAX_WAIT_MS", "500")
+    app_config.get_settings.cache_clear()
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, checking, _ = _setup(client)
+        request = {
+            "headers": {**headers, "Idempotency-Key": str(uuid4())},
+            "json": {"account_id": checking, "type": "deposit", "amount": 50, "currency": "USD"},
+        }
+        # Both requests miss the key up front, so both units reach one group;
+        # the second one's insert conflicts with the first's uncommitted row.
+        lookup = IdempotencyService.lookup
+        lock = threading.Lock()
+        misses = iter([True, True])
+
+        def _racing_lookup(self, *args):
+            with lock:
+                miss = next(misses, False)
+            return None if miss else lookup(self, *args)
+
+        def _slow_commit(_connection) -> None:
+            time.sleep(0.3)
+
+        monkeypatch.setattr(IdempotencyService, "lookup", _racing_lookup)
+        engine = db_session.get_engine()
+        # Hold the shared commit open long enough that an early answer to the
+        # losing unit would look the key up before the winner is visible.
+        event.listen(engine, "commit", _slow_commit)
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                responses = list(
+                    executor.map(lambda _: client.post("/v1/transactions", **request), range(2))
+                )
+        finally:
+            event.remove(engine, "commit", _slow_commit)
+        assert get_db_writer().stats() == {"units": 1, "commits": 1}
+
+    assert [response.status_code for response in responses] == [201, 201]
+    assert responses[0].json() == responses[1].json()
+    assert sorted(response.headers.get("Idempotent-Replayed", "") for response in responses) == [
+        "",
+        "true",
+    ]
+    assert _transaction_count() == 1
+
+
+def test_expired_keys_are_purged(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "idempotent-purge")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, checking, _ = _setup(client)
+        key = str(uuid4())
+        body = {"account_id": checking, "type": "deposit", "amount": 5, "currency": "USD"}
+        client.post("/v1/transactions", headers={**headers, "Idempotency-Key": key}, json=body)
+
+        SessionLocal = db_session.get_sessionmaker()
+        with SessionLocal() as session:
+            session.execute(
+                update(IdempotencyKey).values(expires_at=utc_now() - timedelta(seconds=1))
+            )
+            session.commit()
+
+        # An expired key no longer answers retries and can be reused.
+        retry = client.post(
+            "/v1/transactions", headers={**headers, "Idempotency-Key": key}, json=body
+        )
+        assert retry.status_code == 201
+        assert "Idempotent-Replayed" not in retry.headers
+        assert _transaction_count() == 2
+        with SessionLocal() as session:
+            session.execute(
+                update(IdempotencyKey).values(expires_at=utc_now() - timedelta(seconds=1))
+            )
+            assert IdempotencyService(session).purge_expired() == 1
+            session.commit()
+            assert session.scalar(select(func.count()).select_from(IdempotencyKey)) == 0
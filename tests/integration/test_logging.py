@@ -44,3 +44,5 @@ def test_request_id_generated_and_logged(tmp_path: Path, monkeypatch, capsys) ->
     assert payload["status_code"] == 200
     assert payload["method"] == "GET"
     assert payload["path"] == "/v1/health"
+    assert payload["db_queries"] >= 0
+    assert payload["db_time_ms"] >= 0
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import get_metrics
+from app.db import session as db_session
+from app.main import create_app
+from tests.integration.utils import apply_migrations, configure_test_db, login, signup
+
+
+def test_metrics_endpoint_exposes_runtime_metrics(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "metrics")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        account_response = client.get(
+            "/v1/accounts/42",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+        assert account_response.status_code == 404
+
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/v1/accounts/{account_id}",'
+        'status="404"}'
+    ) in body
+    assert 'http_requests_in_flight{method="GET"} 1' in body
+    assert 'db_queries_total{operation="select"}' in body
+    assert "db_pool_checkout_seconds_count" in body
+    assert "db_pool_connections_opened_total" in body
+    assert "db_pool_size " in body
+    assert "password_hash_duration_seconds_count" in body
+    assert 'token_cache_requests_total{result="miss"}' in body
+    assert "audit_queue_depth" in body
+
+
+def test_pool_metrics_survive_engine_dispose(tmp_path: Path, monkeypatch) -> None:
+    configure_test_db(tmp_path, monkeypatch, "metrics-pool")
+    engine = db_session.get_engine()
+    held = get_metrics().histogram(
+        "db_pool_checkout_seconds", "Time a connection is held between pool checkout and checkin"
+    )
+    opened = get_metrics().counter(
+        "db_pool_connections_opened_total", "DBAPI connections opened by the pool"
+    )
+    before_held, before_opened = held.count(), opened.value()
+
+    engine.dispose()
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SELECT 1")
+
+    assert held.count() == before_held + 1
+    assert opened.value() == before_opened + 1
@@ -0,0 +1,103 @@
+import re
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from app.db import session as db_session
+from app.db.instrumentation import start_query_tracking, stop_query_tracking
+from app.main import create_app
+from tests.integration.utils import (
+    apply_migrations,
+    configure_test_db,
+    login,
+    query_budget,
+    signup,
+)
+
+SERVER_TIMING = re.compile(r'db;dur=(?P<dur>[0-9.]+);desc="(?P<count>\d+) queries"')
+
+
+def _setup(client: TestClient) -> tuple[dict, int]:
+    signup(client, "ada@example.com", "supersecure123")
+    tokens = login(client, "ada@example.com", "supersecure123")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    account_response = client.post(
+        "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+    )
+    return headers, account_response.json()["id"]
+
+
+def _deposit(client: TestClient, headers: dict, account_id: int, count: int) -> None:
+    for _ in range(count):
+        response = client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": account_id, "type": "deposit", "amount": 100, "currency": "USD"},
+        )
+        assert response.status_code == 201
+
+
+def test_server_timing_reports_request_queries(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "server-timing")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, _ = _setup(client)
+        response = client.get("/v1/accounts", headers=headers)
+        health = client.get("/v1/health")
+
+    match = SERVER_TIMING.fullmatch(response.headers["Server-Timing"])
+    assert match is not None
+    assert int(match["count"]) >= 1
+    assert float(match["dur"]) >= 0
+    assert SERVER_TIMING.fullmatch(health.headers["Server-Timing"])
+
+
+def test_statement_query_count_does_not_grow_with_rows(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-budget")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, account_id = _setup(client)
+        _deposit(client, headers, account_id, 2)
+        with query_budget(4) as small:
+            assert client.get(f"/v1/statements/{account_id}", headers=headers).status_code == 200
+
+        _deposit(client, headers, account_id, 10)
+        with query_budget(len(small)) as large:
+            response = client.get(f"/v1/statements/{account_id}", headers=headers)
+        assert len(response.json()["transactions"]) == 12
+
+    assert len(large) == len(small)
+
+
+def test_query_budget_fails_when_exceeded(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "budget-exceeded")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        headers, _ = _setup(client)
+        with pytest.raises(AssertionError, match="expected at most 0 queries"), query_budget(0):
+            client.get("/v1/accounts", headers=headers)
+
+
+def test_failed_statements_leave_no_timing_state(tmp_path: Path, monkeypatch) -> None:
+    configure_test_db(tmp_path, monkeypatch, "query-timing-errors")
+    stats, token = start_query_tracking()
+    try:
+        with db_session.get_engine().connect() as connection:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    connection.exec_driver_sql("SELECT * FROM missing_table")
+            connection.exec_driver_sql("SELECT 1")
+            info = dict(connection.info)
+    finally:
+        stop_query_tracking(token)
+
+    assert stats.count == 1
+    assert "query_start_time" not in info
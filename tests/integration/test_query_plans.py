@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Connection
+
+from app.db import session as db_session
+from app.core.token_cache import Principal
+from app.db.models import Account, AccountHolder, AuditLog, Card, Transfer
+from app.services.account_service import AccountService
+from app.services.statement_service import StatementService
+from tests.integration.utils import apply_migrations, configure_test_db, create_user
+
+
+def _query_plan(connection: Connection, statement: str, parameters) -> str:
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(row[3] for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def _assert_indexed(plan: str, table: str) -> None:
+    assert f"SCAN {table}" not in plan, plan
+    assert f"SEARCH {table} USING" in plan, plan
+    assert "USE TEMP B-TREE" not in plan, plan
+
+
+def _capture_selects(engine, table: str) -> tuple[list[tuple[str, object]], object]:
+    captured: list[tuple[str, object]] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    return captured, _before_cursor_execute
+
+
+def test_service_queries_use_indexes(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "query-plans")
+    apply_migrations(database_url)
+    engine = db_session.get_engine()
+    SessionLocal = db_session.get_sessionmaker()
+
+    with SessionLocal.begin() as session:
+        user = create_user(session, "ada@example.com", "supersecure123")
+        holder = AccountHolder(
+            user_id=user.id, first_name="Ada", last_name="Lovelace", dob=date(1990, 1, 1)
+        )
+        session.add(holder)
+        session.flush()
+        account = Account(holder_id=holder.id, type="checking", currency="USD", balance=0)
+        session.add(account)
+        session.flush()
+        principal = Principal(id=user.id, email=user.email, holder_id=holder.id)
+        user_id, account_id = user.id, account.id
+
+    for table, call in (
+        (
+            "transactions",
+            lambda session: StatementService(session).get_statement(
+                principal, session.get(Account, account_id)
+            ),
+        ),
+        (
+            "transactions",
+            lambda session: AccountService(session).version_for_user(principal, account_id),
+        ),
+        (
+            "accounts",
+            lambda session: AccountService(session).list_for_user(principal),
+        ),
+        (
+            "accounts",
+            lambda session: AccountService(session).list_version_for_user(principal),
+        ),
+    ):
+        captured, listener = _capture_selects(engine, table)
+        try:
+            with SessionLocal() as session:
+                call(session)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert captured, f"no query against {table} captured"
+        with engine.connect() as connection:
+            for statement, parameters in captured:
+                _assert_indexed(_query_plan(connection, statement, parameters), table)
+
+    lookups = (
+        (
+            "transfers",
+            select(Transfer)
+            .where(Transfer.from_account_id == account_id)
+            .order_by(Transfer.created_at.desc()),
+        ),
+        (
+            "transfers",
+            select(Transfer)
+            .where(Transfer.to_account_id == account_id)
+            .order_by(Transfer.created_at.desc()),
+        ),
+        ("cards", select(Card).where(Card.account_id == account_id)),
+        (
+            "audit_logs",
+            select(AuditLog)
+            .where(AuditLog.user_id == user_id)
+            .order_by(AuditLog.created_at.desc()),
+        ),
+    )
+    with engine.connect() as connection:
+        for table, query in lookups:
+            compiled = query.compile(engine)
+            parameters = tuple(compiled.params[name] for name in compiled.positiontup)
+            _assert_indexed(_query_plan(connection, str(compiled), parameters), table)
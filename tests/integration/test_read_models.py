@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import dataclasses
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from app.core.token_cache import Principal
+from app.db import session as db_session
+from app.db.models import Account, AccountHolder, Transaction
+from app.services.account_service import AccountService
+from app.services.read_models import AccountRow, TransactionRow
+from app.services.statement_service import StatementService
+from tests.integration.utils import apply_migrations, configure_test_db, create_user
+
+
+def test_read_paths_return_rows_outside_identity_map(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "read-models")
+    apply_migrations(database_url)
+    SessionLocal = db_session.get_sessionmaker()
+
+    with SessionLocal.begin() as session:
+        user = create_user(session, "ada@example.com", "supersecure123")
+        holder = AccountHolder(
+            user_id=user.id, first_name="Ada", last_name="Lovelace", dob=date(1990, 1, 1)
+        )
+        session.add(holder)
+        session.flush()
+        account = Account(holder_id=holder.id, type="checking", currency="USD", balance=30)
+        session.add(account)
+        session.flush()
+        session.add_all(
+            Transaction(
+                account_id=account.id,
+                type="deposit",
+                amount=10,
+                currency="USD",
+                balance_after=10 * (index + 1),
+            )
+            for index in range(3)
+        )
+        principal = Principal(id=user.id, email=user.email, holder_id=holder.id)
+        account_id = account.id
+
+    with SessionLocal() as session:
+        account = session.get(Account, account_id)
+        page, cursor = StatementService(session).get_statement(principal, account, limit=2)
+        accounts = AccountService(session).list_for_user(principal)
+
+        assert [type(row) for row in page] == [TransactionRow, TransactionRow]
+        assert [row.balance_after for row in page] == [30, 20]
+        assert cursor is not None
+        assert accounts == [
+            AccountRow(
+                id=account_id,
+                holder_id=principal.holder_id,
+                type="checking",
+                currency="USD",
+                balance=30,
+                status="active",
+                created_at=account.created_at,
+            )
+        ]
+        assert list(session.identity_map.values()) == [account]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            page[0].amount = 0
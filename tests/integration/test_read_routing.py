@@ -0,0 +1,184 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select, text
+from sqlalchemy.exc import OperationalError
+
+from app.core import config as app_config
+from app.db import session as db_session
+from app.db.models import Transaction, User
+from app.main import create_app
+from tests.integration.utils import apply_migrations, configure_test_db, login, signup
+
+
+def test_sqlite_read_engine_is_query_only(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "read-pool")
+    apply_migrations(database_url)
+
+    read_engine = db_session.get_read_engine()
+    assert read_engine is not db_session.get_engine()
+    assert read_engine.url == db_session.get_engine().url
+
+    with read_engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM accounts")).scalar_one() == 0
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("DELETE FROM accounts"))
+
+
+def test_read_engine_settings(tmp_path: Path, monkeypatch) -> None:
+    configure_test_db(tmp_path, monkeypatch, "read-settings")
+    monkeypatch.setenv("SQLITE_READ_POOL", "false")
+    app_config.get_settings.cache_clear()
+    assert db_session.get_read_engine() is db_session.get_engine()
+
+    replica = tmp_path / "replica.db"
+    monkeypatch.setenv("READ_DATABASE_URL", f"sqlite:///{replica}")
+    app_config.get_settings.cache_clear()
+    assert db_session.get_read_engine().url.database == str(replica)
+
+
+def test_get_routes_read_from_pool_unless_user_just_wrote(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "read-your-writes")
+    apply_migrations(database_url)
+    monkeypatch.setenv("READ_YOUR_WRITES_SECONDS", "60")
+    app_config.get_settings.cache_clear()
+    db_session.get_recent_writes.cache_clear()
+    read_queries: list[str] = []
+
+    def _record(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        read_queries.append(statement)
+
+    read_engine = db_session.get_read_engine()
+    event.listen(read_engine, "before_cursor_execute", _record)
+    app = create_app()
+    try:
+        with TestClient(app) as client:
+            signup(client, "ada@example.com", "supersecure123")
+            tokens = login(client, "ada@example.com", "supersecure123")
+            headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+            client.post(
+                "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+            )
+
+            fresh = client.get("/v1/accounts", headers=headers)
+            assert fresh.status_code == 200
+            assert len(fresh.json()) == 1
+            assert read_queries == []
+
+            db_session.get_recent_writes.cache_clear()
+            settled = client.get("/v1/accounts", headers=headers)
+            assert settled.status_code == 200
+            assert len(settled.json()) == 1
+            assert read_queries
+    finally:
+        event.remove(read_engine, "before_cursor_execute", _record)
+        db_session.get_recent_writes.cache_clear()
+
+
+@pytest.mark.parametrize("write_mode", ["direct", "serialized", "group"])
+def test_writer_is_marked_and_committed_before_response(
+    tmp_path: Path, monkeypatch, write_mode: str
+) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, f"read-your-writes-{write_mode}")
+    apply_migrations(database_url)
+    monkeypatch.setenv("WRITE_MODE", write_mode)
+    monkeypatch.setenv("READ_YOUR_WRITES_SECONDS", "60")
+    app_config.get_settings.cache_clear()
+    db_session.get_recent_writes.cache_clear()
+    observed: list[tuple[bool, int]] = []
+
+    def _state_at_response_start(user_id: int) -> tuple[bool, int]:
+        with db_session.get_read_engine().connect() as connection:
+            committed = connection.scalar(select(func.count()).select_from(Transaction))
+        return db_session.get_recent_writes().wrote_recently(user_id), committed
+
+    class _ObserveResponseStart:
+        def __init__(self, app) -> None:
+            self.app = app
+
+        async def __call__(self, scope, receive, send) -> None:
+            async def _send(message) -> None:
+                if message["type"] == "http.response.start" and (
+                    scope["path"] == "/v1/transactions"
+                ):
+                    observed.append(_state_at_response_start(user_id))
+                await send(message)
+
+            await self.app(scope, receive, _send)
+
+    app = create_app()
+    app.add_middleware(_ObserveResponseStart)
+    try:
+        with TestClient(app) as client:
+            signup(client, "ada@example.com", "supersecure123")
+            tokens = login(client, "ada@example.com", "supersecure123")
+            headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+            account_id = client.post(
+                "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+            ).json()["id"]
+            with db_session.get_sessionmaker()() as session:
+                user_id = session.scalar(select(User.id).where(User.email == "ada@example.com"))
+            db_session.get_recent_writes.cache_clear()
+
+            response = client.post(
+                "/v1/transactions",
+                headers=headers,
+                json={
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": 100,
+                    "currency": "USD",
+                },
+            )
+            assert response.status_code == 201
+    finally:
+        db_session.get_recent_writes.cache_clear()
+
+    # Teardown runs after the response is sent; the write must not wait for it.
+    assert observed == [(True, 1)]
+
+
+def test_new_account_is_listed_by_a_get_sent_as_the_create_responds(
+    tmp_path: Path, monkeypatch
+) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "read-your-writes-account")
+    apply_migrations(database_url)
+    monkeypatch.setenv("READ_YOUR_WRITES_SECONDS", "60")
+    app_config.get_settings.cache_clear()
+    db_session.get_recent_writes.cache_clear()
+    assert db_session.get_read_engine() is not db_session.get_engine()
+    listed: list[int] = []
+    headers: dict[str, str] = {}
+
+    class _ListOnCreate:
+        def __init__(self, app) -> None:
+            self.app = app
+
+        async def __call__(self, scope, receive, send) -> None:
+            async def _send(message) -> None:
+                if message["type"] == "http.response.start" and (
+                    scope["method"] == "POST" and scope["path"] == "/v1/accounts"
+                ):
+                    # Teardown of the create request has not run yet.
+                    reader = TestClient(app)
+                    listed.append(len(reader.get("/v1/accounts", headers=headers).json()))
+                await send(message)
+
+            await self.app(scope, receive, _send)
+
+    app = create_app()
+    app.add_middleware(_ListOnCreate)
+    try:
+        with TestClient(app) as client:
+            signup(client, "ada@example.com", "supersecure123")
+            tokens = login(client, "ada@example.com", "supersecure123")
+            headers["Authorization"] = f"Bearer {tokens['access_token']}"
+            created = client.post(
+                "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+            )
+            assert created.status_code == 201
+    finally:
+        db_session.get_recent_writes.cache_clear()
+
+    assert listed == [1]
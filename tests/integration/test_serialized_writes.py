@@ -0,0 +1,268 @@
+from datetime import date
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import config as app_config
+from app.core.token_cache import Principal
+from app.db import session as db_session
+from app.db.models import Account, AccountHolder
+from app.db.writer import SerializedWriter, WriteQueueFullError, get_db_writer
+from app.main import create_app
+from app.services.transaction_service import TransactionService
+from tests.integration.utils import (
+    apply_migrations,
+    configure_test_db,
+    create_user,
+    login,
+    signup,
+)
+
+
+def _seed_account(balance: int = 0) -> tuple[Principal, int]:
+    SessionLocal = db_session.get_sessionmaker()
+    with SessionLocal.begin() as session:
+        user = create_user(session, "writer@example.com", "supersecure123")
+        holder = AccountHolder(
+            user_id=user.id, first_name="Ada", last_name="Lovelace", dob=date(1990, 1, 1)
+        )
+        session.add(holder)
+        session.flush()
+        account = Account(holder_id=holder.id, type="checking", currency="USD", balance=balance)
+        session.add(account)
+        session.flush()
+        return Principal(id=user.id, email=user.email, holder_id=holder.id), account.id
+
+
+def test_serialized_writer_runs_units_back_to_back(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "writer-serial")
+    apply_migrations(database_url)
+    user, account_id = _seed_account()
+    writer = SerializedWriter(db_session.get_engine(), queue_size=100)
+    threads: set[str] = set()
+
+    def _deposit(session) -> int:
+        threads.add(threading.current_thread().name)
+        account = session.get(Account, account_id)
+        return TransactionService(session).deposit(user, account, 10, "USD").balance_after
+
+    def _overdraw(session) -> None:
+        account = session.get(Account, account_id)
+        TransactionService(session).withdraw(user, account, 10**9, "USD")
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            balances = list(executor.map(lambda _: writer.submit(_deposit), range(40)))
+        with pytest.raises(ValueError, match="insufficient funds"):
+            writer.submit(_overdraw)
+    finally:
+        writer.stop()
+
+    assert threads == {"db-writer"}
+    assert sorted(balances) == list(range(10, 410, 10))
+    with db_session.get_sessionmaker()() as session:
+        assert session.get(Account, account_id).balance == 400
+
+
+def test_serialized_writer_rejects_when_queue_is_full(tmp_path: Path, monkeypatch) -> None:
+    configure_test_db(tmp_path, monkeypatch, "writer-full")
+    writer = SerializedWriter(db_session.get_engine(), queue_size=1, retry_after=3)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block(_session) -> None:
+        started.set()
+        release.wait(5)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        blocked = executor.submit(writer.submit, _block)
+        assert started.wait(5)
+        queued = executor.submit(writer.submit, lambda _session: "queued")
+        while writer.queue_depth() < 1:
+            pass
+        with pytest.raises(WriteQueueFullError) as exc_info:
+            writer.submit(lambda _session: None)
+        release.set()
+        assert blocked.result() is None
+        assert queued.result() == "queued"
+    writer.stop()
+    assert exc_info.value.retry_after == 3
+
+
+def test_serialized_writer_withdraws_units_that_wait_too_long(
+    tmp_path: Path, monkeypatch
+) -> None:
+    configure_test_db(tmp_path, monkeypatch, "writer-timeout")
+    writer = SerializedWriter(db_session.get_engine(), retry_after=4, submit_timeout=0.1)
+    started = threading.Event()
+    release = threading.Event()
+    ran: list[str] = []
+
+    def _block(_session) -> str:
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        blocked = executor.submit(writer.submit, _block)
+        assert started.wait(5)
+        with pytest.raises(WriteQueueFullError) as exc_info:
+            writer.submit(lambda _session: ran.append("queued"))
+        release.set()
+        # A unit that was already running is waited out, not rejected.
+        assert blocked.result() == "slow"
+    assert writer.submit(lambda _session: "next") == "next"
+    writer.stop()
+    assert exc_info.value.retry_after == 4
+    assert ran == []
+
+
+def test_serialized_writer_fails_outstanding_units_when_thread_dies(
+    tmp_path: Path, monkeypatch
+) -> None:
+    configure_test_db(tmp_path, monkeypatch, "writer-crash")
+    writer = SerializedWriter(db_session.get_engine(), group_size=4, submit_timeout=5)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block(_session) -> None:
+        started.set()
+        release.wait(5)
+
+    def _crash(units: int) -> None:
+        raise RuntimeError("writer crashed")
+
+    writer._record = _crash
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(writer.submit, _block)
+        assert started.wait(5)
+        queued = executor.submit(writer.submit, lambda _session: "queued")
+        while writer.queue_depth() < 1:
+            pass
+        release.set()
+        with pytest.raises(RuntimeError, match="writer crashed"):
+            first.result(5)
+        # Never ran, so the caller gets the retryable 503 path.
+        with pytest.raises(WriteQueueFullError):
+            queued.result(5)
+
+    del writer._record
+    assert not writer.running
+    assert writer.submit(lambda _session: "recovered") == "recovered"
+    writer.stop()
+
+
+def test_group_commit_isolates_failing_units(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "writer-group")
+    apply_migrations(database_url)
+    user, account_id = _seed_account(balance=100)
+    writer = SerializedWriter(
+        db_session.get_engine(), queue_size=100, group_size=16, group_wait=0.05
+    )
+
+    def _unit(index: int):
+        def _apply(session) -> int:
+            account = session.get(Account, account_id)
+            service = TransactionService(session)
+            if index % 5 == 0:
+                return service.withdraw(user, account, 10**9, "USD").balance_after
+            return service.deposit(user, account, 10, "USD").balance_after
+
+        return _apply
+
+    def _submit(index: int) -> int | str:
+        try:
+            return writer.submit(_unit(index))
+        except ValueError as exc:
+            return str(exc)
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(_submit, range(40)))
+    finally:
+        writer.stop()
+
+    failures = [result for result in results if isinstance(result, str)]
+    balances = sorted(result for result in results if isinstance(result, int))
+    assert failures == ["insufficient funds"] * 8
+    assert balances == list(range(110, 430, 10))
+    stats = writer.stats()
+    assert stats["units"] == 32
+    assert stats["commits"] < stats["units"]
+    with db_session.get_sessionmaker()() as session:
+        assert session.get(Account, account_id).balance == 420
+
+
+@pytest.mark.parametrize("write_mode", ["serialized", "group"])
+def test_money_movement_routes_use_writer(tmp_path: Path, monkeypatch, write_mode: str) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, f"writer-routes-{write_mode}")
+    apply_migrations(database_url)
+    monkeypatch.setenv("WRITE_MODE", write_mode)
+    app_config.get_settings.cache_clear()
+    app = create_app()
+
+    with TestClient(app) as client:
+        assert get_db_writer().running
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        first = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        second = client.post(
+            "/v1/accounts", headers=headers, json={"type": "savings", "currency": "USD"}
+        ).json()["id"]
+
+        deposit = client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": first, "type": "deposit", "amount": 500, "currency": "USD"},
+        )
+        assert deposit.status_code == 201
+        assert deposit.json()["balance_after"] == 500
+
+        transfer = client.post(
+            "/v1/transfers",
+            headers=headers,
+            json={
+                "from_account_id": first,
+                "to_account_id": second,
+                "amount": 200,
+                "currency": "USD",
+            },
+        )
+        assert transfer.status_code == 201
+
+        overdraw = client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": second, "type": "withdrawal", "amount": 999, "currency": "USD"},
+        )
+        assert overdraw.status_code == 400
+        missing = client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": 9999, "type": "deposit", "amount": 1, "currency": "USD"},
+        )
+        assert missing.status_code == 404
+
+        accounts = {
+            item["id"]: item["balance"]
+            for item in client.get("/v1/accounts", headers=headers).json()
+        }
+        assert accounts == {first: 300, second: 200}
+
+        def _full(self, fn):
+            raise WriteQueueFullError(2)
+
+        monkeypatch.setattr(SerializedWriter, "submit", _full)
+        busy = client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": first, "type": "deposit", "amount": 1, "currency": "USD"},
+        )
+        assert busy.status_code == 503
+        assert busy.headers["Retry-After"] == "2"
@@ -1,7 +1,12 @@
+import csv
+import io
+import json
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from app.api.routes import statements as statement_routes
+from app.db import session as db_session
 from app.main import create_app
 from tests.integration.utils import (
     apply_migrations,
@@ -47,3 +52,254 @@ def test_statement_returns_summary_and_transactions(tmp_path: Path, monkeypatch)
         assert payload["account_id"] == account_id
         assert payload["balance"] == 1500
         assert len(payload["transactions"]) == 1
+        assert payload["transactions"][0]["balance_after"] == 1500
+
+
+def test_statement_paginates_with_cursor(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-pages")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        account_response = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        )
+        account_id = account_response.json()["id"]
+
+        for amount in range(1, 6):
+            client.post(
+                "/v1/transactions",
+                headers=headers,
+                json={
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": amount,
+                    "currency": "USD",
+                },
+            )
+
+        seen: list[int] = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get(
+                f"/v1/statements/{account_id}", headers=headers, params=params
+            )
+            assert response.status_code == 200
+            payload = response.json()
+            assert len(payload["transactions"]) <= 2
+            seen.extend(item["amount"] for item in payload["transactions"])
+            pages += 1
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert seen == [5, 4, 3, 2, 1]
+
+
+def test_statement_filters_by_date_range(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-range")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        account_response = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        )
+        account_id = account_response.json()["id"]
+        client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": account_id, "type": "deposit", "amount": 100, "currency": "USD"},
+        )
+
+        future = client.get(
+            f"/v1/statements/{account_id}",
+            headers=headers,
+            params={"start": "2999-01-01T00:00:00Z"},
+        )
+        assert future.status_code == 200
+        assert future.json()["transactions"] == []
+
+        past = client.get(
+            f"/v1/statements/{account_id}",
+            headers=headers,
+            params={"start": "2000-01-01T00:00:00Z", "end": "2999-01-01T00:00:00+02:00"},
+        )
+        assert past.status_code == 200
+        assert len(past.json()["transactions"]) == 1
+
+
+def test_statement_rejects_invalid_cursor(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-cursor")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        account_response = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        )
+        account_id = account_response.json()["id"]
+
+        response = client.get(
+            f"/v1/statements/{account_id}",
+            headers=headers,
+            params={"cursor": "not-a-cursor"},
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["message"] == "invalid cursor"
+
+
+def test_statement_export_streams_ndjson_and_csv(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-export")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        account_response = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        )
+        account_id = account_response.json()["id"]
+        for amount in (100, 250, 75):
+            client.post(
+                "/v1/transactions",
+                headers=headers,
+                json={
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": amount,
+                    "currency": "USD",
+                },
+            )
+
+        ndjson = client.get(f"/v1/statements/{account_id}/export", headers=headers)
+        csv_response = client.get(
+            f"/v1/statements/{account_id}/export", headers=headers, params={"format": "csv"}
+        )
+        empty = client.get(
+            f"/v1/statements/{account_id}/export",
+            headers=headers,
+            params={"format": "csv", "start": "2999-01-01T00:00:00Z"},
+        )
+
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [record["amount"] for record in records] == [100, 250, 75]
+    assert set(records[0]) == {
+        "id",
+        "account_id",
+        "type",
+        "amount",
+        "currency",
+        "balance_after",
+        "created_at",
+    }
+    assert [record["balance_after"] for record in records] == [100, 350, 425]
+
+    assert csv_response.status_code == 200
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    assert (
+        csv_response.headers["content-disposition"]
+        == f'attachment; filename="statement-{account_id}.csv"'
+    )
+    rows = list(csv.reader(io.StringIO(csv_response.text)))
+    assert rows[0] == [
+        "id",
+        "account_id",
+        "type",
+        "amount",
+        "currency",
+        "balance_after",
+        "created_at",
+    ]
+    assert [row[3] for row in rows[1:]] == ["100", "250", "75"]
+
+    assert empty.text == "id,account_id,type,amount,currency,balance_after,created_at\n"
+
+
+def test_statement_export_holds_one_connection_while_streaming(
+    tmp_path: Path, monkeypatch
+) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-export-pool")
+    apply_migrations(database_url)
+    app = create_app()
+    checked_out: list[int] = []
+    format_ndjson = statement_routes.format_ndjson
+
+    def _observed(rows):
+        for line in format_ndjson(rows):
+            checked_out.append(db_session.get_engine().pool.checkedout())
+            yield line
+
+    monkeypatch.setattr(statement_routes, "format_ndjson", _observed)
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        account_id = client.post(
+            "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        for amount in (100, 250):
+            client.post(
+                "/v1/transactions",
+                headers=headers,
+                json={
+                    "account_id": account_id,
+                    "type": "deposit",
+                    "amount": amount,
+                    "currency": "USD",
+                },
+            )
+        response = client.get(f"/v1/statements/{account_id}/export", headers=headers)
+
+    assert response.status_code == 200
+    # Only the export's own session holds a connection while rows stream.
+    assert checked_out == [1]
+
+
+def test_statement_export_rejects_foreign_account(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "statement-export-auth")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        signup(client, "grace@example.com", "supersecure123")
+        ada = login(client, "ada@example.com", "supersecure123")
+        grace = login(client, "grace@example.com", "supersecure123")
+
+        account_response = client.post(
+            "/v1/accounts",
+            headers={"Authorization": f"Bearer {ada['access_token']}"},
+            json={"type": "checking", "currency": "USD"},
+        )
+        account_id = account_response.json()["id"]
+        grace_headers = {"Authorization": f"Bearer {grace['access_token']}"}
+
+        foreign = client.get(f"/v1/statements/{account_id}/export", headers=grace_headers)
+        missing = client.get("/v1/statements/9999/export", headers=grace_headers)
+
+    assert foreign.status_code == 403
+    assert missing.status_code == 404
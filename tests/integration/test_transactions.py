@@ -7,6 +7,7 @@ from tests.integration.utils import (
     apply_migrations,
     configure_test_db,
     login,
+    query_budget,
     signup,
 )
 
@@ -115,3 +116,132 @@ def test_transaction_rejects_transfer_types(tmp_path: Path, monkeypatch) -> None
             },
         )
         assert response.status_code == 422
+
+
+def test_transaction_rejects_account_owned_by_another_user(
+    tmp_path: Path, monkeypatch
+) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "foreign-account")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        signup(client, "grace@example.com", "supersecure123")
+        owner_tokens = login(client, "ada@example.com", "supersecure123")
+        other_tokens = login(client, "grace@example.com", "supersecure123")
+
+        account_response = client.post(
+            "/v1/accounts",
+            headers={"Authorization": f"Bearer {owner_tokens['access_token']}"},
+            json={"type": "checking", "currency": "USD"},
+        )
+        account_id = account_response.json()["id"]
+
+        response = client.post(
+            "/v1/transactions",
+            headers={"Authorization": f"Bearer {other_tokens['access_token']}"},
+            json={
+                "account_id": account_id,
+                "type": "deposit",
+                "amount": 100,
+                "currency": "USD",
+            },
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["message"] == "account not accessible"
+
+        missing = client.post(
+            "/v1/transactions",
+            headers={"Authorization": f"Bearer {other_tokens['access_token']}"},
+            json={
+                "account_id": account_id + 100,
+                "type": "deposit",
+                "amount": 100,
+                "currency": "USD",
+            },
+        )
+        assert missing.status_code == 404
+
+
+def test_transaction_batch_applies_items_in_order(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "transaction-batch")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        signup(client, "grace@example.com", "supersecure123")
+        ada_tokens = login(client, "ada@example.com", "supersecure123")
+        grace_tokens = login(client, "grace@example.com", "supersecure123")
+        ada = {"Authorization": f"Bearer {ada_tokens['access_token']}"}
+        grace = {"Authorization": f"Bearer {grace_tokens['access_token']}"}
+        checking = client.post(
+            "/v1/accounts", headers=ada, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        savings = client.post(
+            "/v1/accounts", headers=ada, json={"type": "savings", "currency": "USD"}
+        ).json()["id"]
+        foreign = client.post(
+            "/v1/accounts", headers=grace, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+
+        items = [
+            {"account_id": checking, "type": "deposit", "amount": 100, "currency": "USD"},
+            {"account_id": checking, "type": "withdrawal", "amount": 150, "currency": "USD"},
+            {"account_id": savings, "type": "deposit", "amount": 40, "currency": "USD"},
+            {"account_id": foreign, "type": "deposit", "amount": 10, "currency": "USD"},
+            {"account_id": checking, "type": "deposit", "amount": 5, "currency": "EUR"},
+            {"account_id": checking, "type": "withdrawal", "amount": 60, "currency": "USD"},
+            {"account_id": 9999, "type": "deposit", "amount": 10, "currency": "USD"},
+        ]
+        response = client.post("/v1/transactions/batch", headers=ada, json={"items": items})
+        assert response.status_code == 201
+        payload = response.json()
+        assert payload["created"] == 3
+        assert payload["rejected"] == 4
+        assert [result["index"] for result in payload["results"]] == list(range(7))
+        assert [result["status"] for result in payload["results"]] == [
+            "created",
+            "rejected",
+            "created",
+            "rejected",
+            "rejected",
+            "created",
+            "rejected",
+        ]
+        assert [result["error"] for result in payload["results"]] == [
+            None,
+            "insufficient funds",
+            None,
+            "account not accessible",
+            "currency mismatch",
+            None,
+            "account not found",
+        ]
+        assert [
+            result["transaction"]["balance_after"]
+            for result in payload["results"]
+            if result["transaction"]
+        ] == [100, 40, 40]
+
+        balances = {
+            item["id"]: item["balance"] for item in client.get("/v1/accounts", headers=ada).json()
+        }
+        assert balances == {checking: 40, savings: 40}
+        statement = client.get(f"/v1/statements/{checking}", headers=ada).json()
+        assert [item["amount"] for item in statement["transactions"]] == [60, 100]
+
+        large = [
+            {"account_id": account_id, "type": "deposit", "amount": 1, "currency": "USD"}
+            for account_id in (checking, savings) * 100
+        ]
+        with query_budget(8):
+            bulk = client.post("/v1/transactions/batch", headers=ada, json={"items": large})
+        assert bulk.status_code == 201
+        assert bulk.json()["created"] == 200
+
+        too_many = client.post("/v1/transactions/batch", headers=ada, json={"items": large * 6})
+        assert too_many.status_code == 422
+        empty = client.post("/v1/transactions/batch", headers=ada, json={"items": []})
+        assert empty.status_code == 422
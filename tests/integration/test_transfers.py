@@ -7,6 +7,7 @@ from tests.integration.utils import (
     apply_migrations,
     configure_test_db,
     login,
+    query_budget,
     signup,
 )
 
@@ -95,3 +96,109 @@ def test_transfer_rejects_same_account(tmp_path: Path, monkeypatch) -> None:
             },
         )
         assert transfer_response.status_code == 400
+
+
+def test_transfer_batch_nets_balances_in_one_transaction(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "transfer-batch")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        tokens = login(client, "ada@example.com", "supersecure123")
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        first, second, third = (
+            client.post(
+                "/v1/accounts", headers=headers, json={"type": "checking", "currency": "USD"}
+            ).json()["id"]
+            for _ in range(3)
+        )
+        client.post(
+            "/v1/transactions",
+            headers=headers,
+            json={"account_id": first, "type": "deposit", "amount": 1000, "currency": "USD"},
+        )
+
+        items = [
+            {"from_account_id": first, "to_account_id": second, "amount": 1, "currency": "USD"},
+            {"from_account_id": second, "to_account_id": third, "amount": 1, "currency": "USD"},
+            {"from_account_id": third, "to_account_id": first, "amount": 1, "currency": "USD"},
+        ] * 200 + [
+            {"from_account_id": first, "to_account_id": third, "amount": 300, "currency": "USD"}
+        ]
+        with query_budget(12):
+            response = client.post("/v1/transfers/batch", headers=headers, json={"items": items})
+        assert response.status_code == 201
+        payload = response.json()
+        assert len(payload["transfers"]) == 601
+        assert payload["transfers"][-1]["amount"] == 300
+        assert {change["account_id"]: change for change in payload["net_changes"]} == {
+            first: {"account_id": first, "delta": -300, "balance": 700},
+            second: {"account_id": second, "delta": 0, "balance": 0},
+            third: {"account_id": third, "delta": 300, "balance": 300},
+        }
+
+        balances = {
+            item["id"]: item["balance"]
+            for item in client.get("/v1/accounts", headers=headers).json()
+        }
+        assert balances == {first: 700, second: 0, third: 300}
+        statement = client.get(f"/v1/statements/{second}", headers=headers).json()
+        assert {row["balance_after"] for row in statement["transactions"]} == {0, 1}
+
+
+def test_transfer_batch_is_all_or_nothing(tmp_path: Path, monkeypatch) -> None:
+    database_url = configure_test_db(tmp_path, monkeypatch, "transfer-batch-reject")
+    apply_migrations(database_url)
+    app = create_app()
+
+    with TestClient(app) as client:
+        signup(client, "ada@example.com", "supersecure123")
+        signup(client, "grace@example.com", "supersecure123")
+        ada_tokens = login(client, "ada@example.com", "supersecure123")
+        grace_tokens = login(client, "grace@example.com", "supersecure123")
+        ada = {"Authorization": f"Bearer {ada_tokens['access_token']}"}
+        grace = {"Authorization": f"Bearer {grace_tokens['access_token']}"}
+        checking = client.post(
+            "/v1/accounts", headers=ada, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        euros = client.post(
+            "/v1/accounts", headers=ada, json={"type": "savings", "currency": "EUR"}
+        ).json()["id"]
+        foreign = client.post(
+            "/v1/accounts", headers=grace, json={"type": "checking", "currency": "USD"}
+        ).json()["id"]
+        client.post(
+            "/v1/transactions",
+            headers=ada,
+            json={"account_id": checking, "type": "deposit", "amount": 100, "currency": "USD"},
+        )
+
+        items = [
+            {"from_account_id": source, "to_account_id": target, "amount": amount, "currency": cur}
+            for source, target, amount, cur in (
+                (checking, foreign, 60, "USD"),
+                (checking, foreign, 60, "USD"),
+                (foreign, checking, 1, "USD"),
+                (checking, euros, 1, "USD"),
+                (checking, 9999, 1, "USD"),
+                (checking, checking, 1, "USD"),
+            )
+        ]
+        response = client.post("/v1/transfers/batch", headers=ada, json={"items": items})
+        assert response.status_code == 400
+        assert response.json()["error"]["details"] == [
+            {"index": 1, "error": "insufficient funds"},
+            {"index": 2, "error": "account not accessible"},
+            {"index": 3, "error": "currency mismatch"},
+            {"index": 4, "error": "account not found"},
+            {"index": 5, "error": "cannot transfer to same account"},
+        ]
+
+        assert client.get(f"/v1/accounts/{checking}", headers=ada).json()["balance"] == 100
+        assert client.get(f"/v1/accounts/{foreign}", headers=grace).json()["balance"] == 0
+        statement = client.get(f"/v1/statements/{checking}", headers=ada).json()
+        assert len(statement["transactions"]) == 1
+
+        empty = client.post("/v1/transfers/batch", headers=ada, json={"items": []})
+        assert empty.status_code == 422
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.core import config as app_config
@@ -59,3 +62,24 @@ def create_user(session: Session, email: str, password: str) -> User:
     session.add(user)
     session.flush()
     return user
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[list[str]]:
+    engines = {db_session.get_engine(), db_session.get_read_engine()}
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        statements.append(statement)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _record)
+    assert len(statements) <= max_queries, (
+        f"expected at most {max_queries} queries, got {len(statements)}:\n"
+        + "\n".join(statements)
+    )
@@ -0,0 +1,31 @@
+import json
+from datetime import datetime, timezone
+
+from app.core import responses
+from app.schemas.accounts import AccountRead
+
+
+class _Row:
+    id = 7
+    holder_id = 3
+    type = "checking"
+    currency = "USD"
+    balance = 1250
+    status = "active"
+    created_at = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    internal_note = "not part of the schema"
+
+
+def test_trusted_dump_copies_schema_fields_only() -> None:
+    dumped = responses.trusted_dump(AccountRead, _Row())
+
+    assert list(dumped) == list(AccountRead.model_fields)
+    assert AccountRead.model_validate(dumped).model_dump() == dumped
+
+
+def test_dumps_matches_pydantic_json() -> None:
+    row = responses.trusted_dump(AccountRead, _Row())
+    expected = json.loads(AccountRead.model_validate(row).model_dump_json())
+
+    assert json.loads(responses.dumps(row)) == expected
+    assert responses.dumps({"when": datetime(2024, 1, 1).date()}) == b'{"when":"2024-01-01"}'
@@ -0,0 +1,56 @@
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+
+def test_registry_renders_counters_and_gauges() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("jobs_total", "Jobs processed", ("kind",))
+    requests.inc(kind="a")
+    requests.inc(2, kind="b")
+    registry.gauge("queue_depth", "Queued jobs").set(3)
+
+    output = registry.render()
+
+    assert "# TYPE jobs_total counter" in output
+    assert 'jobs_total{kind="a"} 1' in output
+    assert 'jobs_total{kind="b"} 2' in output
+    assert "# TYPE queue_depth gauge" in output
+    assert "queue_depth 3" in output
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, route="/a")
+    latency.observe(0.1, route="/a")
+    latency.observe(5, route="/a")
+
+    output = registry.render()
+
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in output
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in output
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in output
+    assert 'latency_seconds_count{route="/a"} 3' in output
+    assert 'latency_seconds_sum{route="/a"} 5.15' in output
+
+
+def test_registry_escapes_label_values_and_rejects_type_conflicts() -> None:
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events", ("name",)).inc(name='say "hi"')
+
+    assert 'events_total{name="say \\"hi\\""} 1' in registry.render()
+    with pytest.raises(ValueError):
+        registry.gauge("events_total", "Events")
+
+
+def test_registry_includes_collector_families() -> None:
+    registry = MetricsRegistry()
+
+    def _collector():
+        yield "pool_size", "gauge", "Pool size", [("pool_size", {}, 5)]
+
+    registry.register_collector(_collector)
+    registry.register_collector(_collector)
+
+    assert registry.render().count("# TYPE pool_size gauge") == 1
@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from app.core.hashing import PasswordHashingBusyError, PasswordHashingExecutor
+
+
+def test_executor_runs_work_and_records_latency() -> None:
+    executor = PasswordHashingExecutor(workers=2, max_queue=2)
+
+    assert executor.run(lambda value: value * 2, 21) == 42
+    stats = executor.stats()
+    assert stats["completed_total"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["in_progress"] == 0
+    executor.shutdown()
+
+
+def test_executor_rejects_when_saturated() -> None:
+    executor = PasswordHashingExecutor(workers=1, max_queue=0, retry_after=3)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block() -> None:
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=executor.run, args=(_block,))
+    worker.start()
+    started.wait(5)
+    try:
+        with pytest.raises(PasswordHashingBusyError) as exc_info:
+            executor.run(lambda: None)
+        assert exc_info.value.retry_after == 3
+        assert executor.stats()["in_progress"] == 1
+    finally:
+        release.set()
+        worker.join(5)
+
+    assert executor.stats()["rejected_total"] == 1
+    executor.shutdown()
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core.logging import configure_logging
+from app.core.middleware import RequestLoggingMiddleware
+
+
+def _events(stdout: str) -> list[dict]:
+    events = []
+    for line in stdout.splitlines():
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return events
+
+
+def _build_app() -> Starlette:
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    async def stream(request):
+        async def chunks():
+            for index in range(3):
+                yield f"chunk-{index}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def boom(request):
+        raise RuntimeError("boom")
+
+    app = Starlette(
+        routes=[Route("/ok", ok), Route("/stream", stream), Route("/boom", boom)]
+    )
+    app.add_middleware(RequestLoggingMiddleware)
+    return app
+
+
+def test_middleware_propagates_incoming_request_id(capsys) -> None:
+    configure_logging("INFO")
+    with TestClient(_build_app()) as client:
+        response = client.get("/ok", headers={"X-Request-Id": "req-123"})
+
+    assert response.headers["X-Request-Id"] == "req-123"
+    completed = [e for e in _events(capsys.readouterr().out) if e["event"] == "request.completed"]
+    assert completed[-1]["request_id"] == "req-123"
+    assert completed[-1]["status_code"] == 200
+    assert completed[-1]["path"] == "/ok"
+
+
+def test_middleware_passes_streaming_responses_through() -> None:
+    with TestClient(_build_app()) as client:
+        response = client.get("/stream")
+
+    assert response.headers["X-Request-Id"]
+    assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+
+
+def test_middleware_logs_failed_requests(capsys) -> None:
+    configure_logging("INFO")
+    with TestClient(_build_app()) as client, pytest.raises(RuntimeError):
+        client.get("/boom")
+
+    failed = [e for e in _events(capsys.readouterr().out) if e["event"] == "request.failed"]
+    assert failed[-1]["status_code"] == 500
+    assert failed[-1]["path"] == "/boom"
@@ -0,0 +1,15 @@
+from app.core.security import create_access_token, decode_access_token
+
+
+def test_access_token_embeds_holder_id() -> None:
+    token, _ = create_access_token(1, "ada@example.com", holder_id=7)
+    claims = decode_access_token(token)
+
+    assert claims["sub"] == "1"
+    assert claims["holder_id"] == 7
+
+
+def test_access_token_omits_missing_holder_id() -> None:
+    token, _ = create_access_token(1, "ada@example.com")
+
+    assert "holder_id" not in decode_access_token(token)
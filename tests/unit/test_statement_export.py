@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from app.services.statement_service import format_csv, format_ndjson
+
+
+def _rows(count: int) -> list[tuple]:
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [(index, 1, "deposit", index * 10, "USD", None, created_at) for index in range(count)]
+
+
+def test_format_ndjson_emits_batched_chunks() -> None:
+    chunks = list(format_ndjson(_rows(5), batch_size=2))
+
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+    assert chunks[0].startswith('{"id":0,"account_id":1,"type":"deposit","amount":0,')
+
+
+def test_format_csv_writes_header_first() -> None:
+    chunks = list(format_csv(_rows(3), batch_size=2))
+
+    assert chunks[0] == "id,account_id,type,amount,currency,balance_after,created_at\n"
+    assert chunks[1].splitlines()[0] == "0,1,deposit,0,USD,,2024-01-01T00:00:00+00:00"
+    assert [chunk.count("\n") for chunk in chunks[1:]] == [2, 1]
@@ -0,0 +1,47 @@
+from time import time
+
+from app.core.token_cache import Principal, TokenCache
+
+
+def test_token_cache_counts_hits_and_misses() -> None:
+    cache = TokenCache(max_entries=10)
+    principal = Principal(id=1, email="ada@example.com", holder_id=7)
+
+    assert cache.get("token-a") is None
+    cache.put("token-a", {"exp": time() + 60}, principal)
+    assert cache.get("token-a") == principal
+
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_token_cache_expires_entries_at_token_expiry() -> None:
+    cache = TokenCache(max_entries=10)
+    cache.put("token-a", {"exp": time() - 1}, Principal(id=1, email="ada@example.com"))
+
+    assert cache.get("token-a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_token_cache_evicts_least_recently_used() -> None:
+    cache = TokenCache(max_entries=2)
+    expires = {"exp": time() + 60}
+    cache.put("token-a", expires, Principal(id=1, email="a@example.com"))
+    cache.put("token-b", expires, Principal(id=2, email="b@example.com"))
+    cache.get("token-a")
+    cache.put("token-c", expires, Principal(id=3, email="c@example.com"))
+
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") is not None
+    assert cache.get("token-c") is not None
+
+
+def test_token_cache_invalidates_user() -> None:
+    cache = TokenCache(max_entries=10)
+    expires = {"exp": time() + 60}
+    cache.put("token-a", expires, Principal(id=1, email="a@example.com"))
+    cache.put("token-b", expires, Principal(id=2, email="b@example.com"))
+
+    cache.invalidate_user(1)
+
+    assert cache.get("token-a") is None
+    assert cache.get("token-b") is not None